@@ -2,17 +2,28 @@
 """Push OHLCV data to HuggingFace Hub."""
 
 import argparse
+import contextlib
+import hashlib
+import json
 import sys
+import time
 from datetime import date
-
-from huggingface_hub import HfApi, repo_exists
-from huggingface_hub.utils import HfHubHTTPError
+from typing import TYPE_CHECKING, Any
 
 from finetl import FinETL
+from finetl.config.loader import cache_dir, write_private_file
+
+if TYPE_CHECKING:
+    from huggingface_hub import HfApi
 
 # yfinance has data from ~1962 for some stocks
 EARLIEST_DATE = "1900-01-01"
 
+# Reuse a successful whoami result for an hour to skip the round trip on
+# repeated runs with the same token
+WHOAMI_CACHE_NAME = "hf_whoami.json"
+WHOAMI_CACHE_TTL = 3600
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -73,11 +84,51 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def validate_hf_credentials() -> HfApi:
+def cached_whoami(api: "HfApi") -> dict[str, Any]:
+    """Return api.whoami(), reusing a recent result for the same token."""
+    from huggingface_hub import get_token
+
+    token = get_token()
+    if token is None:
+        return api.whoami()
+
+    # Only a hash of the token is stored
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    # The cached result includes the account's email and orgs, so it is
+    # written readable only by the current user
+    cache_path = cache_dir() / WHOAMI_CACHE_NAME
+    try:
+        cached = json.loads(cache_path.read_text())
+        fresh = time.time() - cached["timestamp"] < WHOAMI_CACHE_TTL
+        if cached["token_hash"] == token_hash and fresh:
+            return cached["user_info"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    user_info = api.whoami()
+    # Failing to write only costs a whoami call next run
+    with contextlib.suppress(OSError):
+        write_private_file(
+            cache_path,
+            json.dumps(
+                {
+                    "token_hash": token_hash,
+                    "timestamp": time.time(),
+                    "user_info": user_info,
+                }
+            ),
+        )
+    return user_info
+
+
+def validate_hf_credentials() -> "HfApi":
     """Validate HuggingFace credentials and return API client."""
+    from huggingface_hub import HfApi
+    from huggingface_hub.utils import HfHubHTTPError
+
     api = HfApi()
     try:
-        user_info = api.whoami()
+        user_info = cached_whoami(api)
         print(f"Authenticated as: {user_info['name']}")
         return api
     except HfHubHTTPError as e:
@@ -86,8 +137,10 @@ def validate_hf_credentials() -> HfApi:
         sys.exit(1)
 
 
-def validate_repo(api: HfApi, repo_id: str, create: bool, private: bool) -> None:
+def validate_repo(api: "HfApi", repo_id: str, create: bool, private: bool) -> None:
     """Check if repo exists, optionally create it."""
+    from huggingface_hub import repo_exists
+
     if repo_exists(repo_id, repo_type="dataset"):
         print(f"Repository exists: {repo_id}")
     elif create:
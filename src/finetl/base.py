@@ -27,3 +27,9 @@ class BaseLoader(ABC):
     def load(self, data: "ExtractedData") -> None:
         """Load extracted data to the destination."""
         pass
+
+    def wait(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Block until any work started in the background by load() is done."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release resources such as connections held by the loader."""
@@ -1,5 +1,9 @@
 """YAML configuration loading and validation."""
 
+import hashlib
+import os
+import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,18 +13,36 @@ from pydantic import ValidationError
 from finetl.config.schema import FinETLConfig
 from finetl.exceptions import ConfigurationError
 
+# yaml.safe_load silently uses the pure-Python loader; prefer libyaml's
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-def load_yaml(path: str | Path) -> dict[str, Any]:
-    """Load a YAML file and return its contents as a dictionary."""
-    path = Path(path)
+    warnings.warn(
+        "libyaml is not available; YAML configs will be parsed with the "
+        "much slower pure-Python loader",
+        stacklevel=2,
+    )
+
+
+def _check_config_path(path: Path) -> None:
+    """Raise ConfigurationError if path is not an existing file."""
     if not path.exists():
         raise ConfigurationError(f"Config file not found: {path}")
     if not path.is_file():
         raise ConfigurationError(f"Config path is not a file: {path}")
 
+
+def load_yaml(path: str | Path) -> dict[str, Any]:
+    """Load a YAML file and return its contents as a dictionary."""
+    path = Path(path)
+    _check_config_path(path)
+
     try:
         with open(path) as f:
-            data = yaml.safe_load(f)
+            text = f.read()
+        data = yaml.load(text, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML syntax: {e}") from e
 
@@ -31,9 +53,84 @@ def load_yaml(path: str | Path) -> dict[str, Any]:
 
 
 def load_config(path: str | Path) -> FinETLConfig:
-    """Load and validate a FinETL configuration from a YAML file."""
-    data = load_yaml(path)
-    return parse_config(data)
+    """Load and validate a FinETL configuration from a YAML file.
+
+    Parsed configs are cached per file and modification time, so loading an
+    unchanged file again skips YAML parsing and validation. The validated
+    config is also written to a JSON sidecar under the cache directory
+    (FINETL_CACHE_DIR, default ~/.cache/finetl) so later runs can skip YAML
+    parsing too, unless it holds a database password.
+    """
+    path = Path(path)
+    _check_config_path(path)
+    mtime_ns = path.stat().st_mtime_ns
+    config = _load_config_cached(str(path.resolve()), mtime_ns)
+    # Hand out a copy so callers can't mutate the cached instance
+    return config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=128)
+def _load_config_cached(path: str, mtime_ns: int) -> FinETLConfig:
+    """Load and validate a config file; mtime_ns is only part of the cache key."""
+    sidecar = _sidecar_path(path)
+    config = _read_sidecar(sidecar, mtime_ns)
+    if config is None:
+        config = parse_config(load_yaml(path))
+        _write_sidecar(sidecar, mtime_ns, config)
+    return config
+
+
+def cache_dir() -> Path:
+    """Return the FinETL cache directory (FINETL_CACHE_DIR, ~/.cache/finetl)."""
+    override = os.environ.get("FINETL_CACHE_DIR")
+    return Path(override) if override else Path.home() / ".cache" / "finetl"
+
+
+def write_private_file(path: Path, text: str) -> None:
+    """Write text to path, readable only by the current user."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # The mode passed to open only applies when the file is created
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+
+
+def _sidecar_path(path: str) -> Path:
+    """Return the JSON sidecar location for a resolved config path."""
+    digest = hashlib.sha256(path.encode()).hexdigest()[:16]
+    return cache_dir() / f"config-{digest}.json"
+
+
+def _read_sidecar(sidecar: Path, mtime_ns: int) -> FinETLConfig | None:
+    """Return the cached config if the sidecar matches mtime_ns, else None."""
+    try:
+        header, _, body = sidecar.read_text().partition("\n")
+        if header != str(mtime_ns):
+            return None
+        # JSON validation runs in pydantic-core and is much cheaper than YAML
+        return FinETLConfig.model_validate_json(body)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(sidecar: Path, mtime_ns: int, config: FinETLConfig) -> None:
+    """Write a config sidecar, ignoring failures since it is only a cache.
+
+    Configs holding a database password are not written, and any sidecar
+    left for them is removed, so credentials never end up in the cache.
+    Only explicitly set fields are stored, so defaults changed by a later
+    FinETL release apply to cached configs too.
+    """
+    try:
+        if config.loading.password:
+            sidecar.unlink(missing_ok=True)
+            return
+        write_private_file(
+            sidecar, f"{mtime_ns}\n{config.model_dump_json(exclude_unset=True)}"
+        )
+    except OSError:
+        pass
 
 
 def parse_config(data: dict[str, Any]) -> FinETLConfig:
@@ -67,6 +67,7 @@ class FinancialsConfig(BaseModel):
             StatementType.CASH_FLOW,
         ]
     )
+    metrics: list[str] | None = None
 
 
 class DataTypesConfig(BaseModel):
@@ -90,6 +91,7 @@ class ExtractionConfig(BaseModel):
     source: Literal["yfinance"] = "yfinance"
     tickers: list[str] = Field(..., min_length=1)
     data_types: DataTypesConfig
+    max_workers: int = Field(default=8, ge=1)
 
 
 class IfExistsType(str, Enum):
@@ -103,12 +105,24 @@ class IfExistsType(str, Enum):
 class LoadingConfig(BaseModel):
     """Configuration for data loading."""
 
-    destination: Literal["csv", "parquet", "huggingface", "postgresql"] = "csv"
+    destination: Literal["csv", "parquet", "huggingface", "postgresql", "arrow"] = "csv"
     path: str = "./output"
 
+    # CSV-specific options
+    # Arrow's default of 1024 rows per batch is small for narrow numeric
+    # tables; larger batches mean fewer per-batch overheads while still
+    # fitting in cache
+    csv_batch_size: int = Field(default=8192, ge=1)
+
+    # Parquet-specific options
+    compression: Literal["zstd", "snappy", "gzip", "brotli", "lz4", "none"] = "zstd"
+    row_group_size: int = Field(default=1_000_000, ge=1)
+
     # HuggingFace-specific options
     repo_id: str | None = None
     private: bool = False
+    fast_upload: bool = True
+    num_proc: int | None = Field(default=None, ge=1)
 
     # PostgreSQL-specific options
     host: str | None = None
@@ -118,6 +132,10 @@ class LoadingConfig(BaseModel):
     user: str | None = None
     password: str | None = None
     if_exists: IfExistsType = IfExistsType.APPEND
+    use_copy: bool = True
+    chunksize: int | None = Field(default=None, ge=1)
+    binary_copy: bool = False
+    upsert: bool = False
 
     @model_validator(mode="after")
     def validate_destination_config(self) -> "LoadingConfig":
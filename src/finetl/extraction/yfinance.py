@@ -1,10 +1,12 @@
 """Yahoo Finance data extractor."""
 
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
 from finetl.base import BaseExtractor
 from finetl.config.schema import (
@@ -15,6 +17,9 @@ from finetl.config.schema import (
 from finetl.exceptions import ExtractionError
 from finetl.models import ExtractedData
 
+if TYPE_CHECKING:
+    import yfinance as yf
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +29,9 @@ class YFinanceExtractor(BaseExtractor):
     def __init__(self, config: ExtractionConfig) -> None:
         self.config = config
         self.tickers = config.tickers
+        # Ticker objects are reused across data types so each symbol's
+        # cached metadata and connections are set up once per run
+        self._ticker_cache: dict[str, yf.Ticker] = {}
 
     def extract(self) -> ExtractedData:
         """Extract all configured data types."""
@@ -46,54 +54,51 @@ class YFinanceExtractor(BaseExtractor):
 
     def _extract_ohlcv(self) -> pd.DataFrame:
         """Extract OHLCV data for all tickers."""
-        ohlcv_config = self.config.data_types.ohlcv
-        if ohlcv_config is None:
+        if self.config.data_types.ohlcv is None:
             raise ExtractionError("OHLCV config is not set")
 
-        try:
-            data = yf.download(
-                tickers=self.tickers,
-                start=ohlcv_config.start_date.isoformat(),
-                end=ohlcv_config.end_date.isoformat(),
-                interval=ohlcv_config.interval.value,
-                group_by="ticker",
-                auto_adjust=True,
-                progress=False,
-            )
-        except Exception as e:
-            raise ExtractionError(f"Failed to download OHLCV data: {e}") from e
-
-        if data.empty:
+        # Each ticker is an independent HTTP request, so fan them out across
+        # a thread pool instead of waiting on Yahoo one ticker at a time
+        max_workers = min(self.config.max_workers, len(self.tickers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._download_ohlcv, self.tickers))
+
+        if all(frame is None for frame in results):
+            raise ExtractionError("Failed to download OHLCV data for every ticker")
+
+        symbols = [
+            s
+            for s, frame in zip(self.tickers, results, strict=True)
+            if frame is not None and not frame.empty
+        ]
+        frames = [frame for frame in results if frame is not None and not frame.empty]
+        if not frames:
             logger.warning("No OHLCV data returned")
             return pd.DataFrame()
 
-        # Handle single vs multiple tickers
-        if len(self.tickers) == 1:
-            # Single ticker: simple DataFrame with OHLCV columns
-            df = data.reset_index()
-            df["ticker"] = self.tickers[0]
-        else:
-            # Multiple tickers: MultiIndex columns (ticker, price_type)
-            frames = []
-            for ticker in self.tickers:
-                if ticker in data.columns.get_level_values(0):
-                    ticker_data = data[ticker].copy()
-                    ticker_data = ticker_data.reset_index()
-                    ticker_data["ticker"] = ticker
-                    frames.append(ticker_data)
-            if not frames:
-                return pd.DataFrame()
-            df = pd.concat(frames, ignore_index=True)
-
-        # Standardize column names
-        df.columns = df.columns.str.lower()
-
-        # Handle various date column names from yfinance
-        date_columns = ["date", "datetime", "index"]
-        for col in date_columns:
-            if col in df.columns and col != "date":
-                df = df.rename(columns={col: "date"})
-                break
+        # Build each output column with a single concatenate rather than
+        # tagging per-ticker DataFrames and concatenating those
+        first = frames[0]
+        columns: dict[str, Any] = {
+            "ticker": pd.Categorical(
+                np.repeat(symbols, [len(frame) for frame in frames]),
+                categories=self._ticker_categories(),
+            ),
+            # The index is Date or Datetime depending on the interval
+            "date": first.index.append([frame.index for frame in frames[1:]]),
+        }
+        for col in first.columns:
+            if all(col in frame.columns for frame in frames[1:]):
+                columns[col] = np.concatenate(
+                    [frame[col].to_numpy() for frame in frames]
+                )
+            else:
+                logger.warning("Dropping OHLCV column %s missing for some tickers", col)
+        df = pd.DataFrame(columns)
+
+        # Standardize column names; a plain list avoids building a pandas
+        # string array for a handful of labels
+        df.columns = [c.lower() if isinstance(c, str) else c for c in df.columns]
 
         # Reorder columns
         cols = ["ticker", "date", "open", "high", "low", "close", "volume"]
@@ -102,6 +107,59 @@ class YFinanceExtractor(BaseExtractor):
 
         return df
 
+    def _ticker_categories(self) -> list[str]:
+        """Return the configured tickers, deduplicated, as ticker categories.
+
+        Storing the ticker column as a categorical keeps one copy of each
+        symbol in memory and is written dictionary-encoded to Parquet/Arrow.
+        """
+        return list(dict.fromkeys(self.tickers))
+
+    def _get_ticker(self, ticker_symbol: str) -> "yf.Ticker":
+        """Return the shared yf.Ticker for a symbol, creating it on first use."""
+        # Imported here as yfinance is slow to import and only needed once
+        # an extraction actually runs
+        import yfinance as yf
+
+        ticker = self._ticker_cache.get(ticker_symbol)
+        if ticker is None:
+            ticker = self._ticker_cache.setdefault(
+                ticker_symbol, yf.Ticker(ticker_symbol)
+            )
+        return ticker
+
+    def _download_ohlcv(self, ticker_symbol: str) -> pd.DataFrame | None:
+        """Download OHLCV data for a single ticker, or None if it fails."""
+        ohlcv_config = self.config.data_types.ohlcv
+        interval = ohlcv_config.interval.value
+
+        # Ticker.history is used rather than yf.download because download
+        # keeps its results in module-level state and is not safe to call
+        # from several threads at once
+        try:
+            data = self._get_ticker(ticker_symbol).history(
+                start=ohlcv_config.start_date.isoformat(),
+                end=ohlcv_config.end_date.isoformat(),
+                interval=interval,
+                auto_adjust=True,
+                actions=False,
+            )
+        except Exception as e:
+            logger.warning("Failed to download OHLCV for %s: %s", ticker_symbol, e)
+            return None
+        if data.empty:
+            return data
+
+        # Match yf.download: intraday timestamps in UTC, daily and longer
+        # intervals without a timezone
+        if data.index.tz is not None:
+            if interval.endswith(("m", "h")):
+                data.index = data.index.tz_convert("UTC")
+            else:
+                data.index = data.index.tz_localize(None)
+
+        return data
+
     def _extract_financials(self) -> pd.DataFrame:
         """Extract and merge financial statements for all tickers."""
         financials_config = self.config.data_types.financials
@@ -110,70 +168,94 @@ class YFinanceExtractor(BaseExtractor):
 
         quarterly = financials_config.frequency == Frequency.QUARTERLY
         statements = financials_config.statements
-
-        all_ticker_data = []
-
-        for ticker_symbol in self.tickers:
-            logger.debug("Extracting financials for %s", ticker_symbol)
-            try:
-                ticker = yf.Ticker(ticker_symbol)
-                ticker_financials = self._get_ticker_financials(
-                    ticker, statements, quarterly
-                )
-                if ticker_financials is not None and not ticker_financials.empty:
-                    ticker_financials["ticker"] = ticker_symbol
-                    all_ticker_data.append(ticker_financials)
-            except Exception as e:
-                logger.warning(
-                    "Failed to extract financials for %s: %s", ticker_symbol, e
-                )
+        metrics = financials_config.metrics
+
+        fetch = partial(
+            self._fetch_ticker_financials,
+            statements=statements,
+            quarterly=quarterly,
+            metrics=metrics,
+        )
+        max_workers = min(self.config.max_workers, len(self.tickers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(fetch, self.tickers)
+            all_ticker_data = [df for df in results if df is not None]
 
         if not all_ticker_data:
             logger.warning("No financial data extracted")
             return pd.DataFrame()
 
-        # Combine all tickers
+        # Every per-ticker frame already starts with ticker and period, so
+        # the combined frame needs no reordering copy afterwards
         df = pd.concat(all_ticker_data, ignore_index=True)
-
-        # Reorder columns to put ticker and period first
-        cols = df.columns.tolist()
-        cols.remove("ticker")
-        cols.remove("period")
-        df = df[["ticker", "period"] + cols]
+        df["ticker"] = pd.Categorical(
+            df["ticker"], categories=self._ticker_categories()
+        )
 
         return df
 
+    def _fetch_ticker_financials(
+        self,
+        ticker_symbol: str,
+        statements: list[StatementType],
+        quarterly: bool,
+        metrics: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """Fetch merged financial statements for a single ticker symbol."""
+        logger.debug("Extracting financials for %s", ticker_symbol)
+        try:
+            ticker = self._get_ticker(ticker_symbol)
+            ticker_financials = self._get_ticker_financials(
+                ticker, statements, quarterly, metrics
+            )
+        except Exception as e:
+            logger.warning("Failed to extract financials for %s: %s", ticker_symbol, e)
+            return None
+
+        if ticker_financials is None or ticker_financials.empty:
+            return None
+
+        ticker_financials.insert(0, "ticker", ticker_symbol)
+        return ticker_financials
+
     def _get_ticker_financials(
         self,
         ticker: Any,
         statements: list[StatementType],
         quarterly: bool,
+        metrics: list[str] | None = None,
     ) -> pd.DataFrame | None:
         """Get and merge financial statements for a single ticker."""
-        statement_dfs = []
-
-        for statement_type in statements:
-            df = self._get_statement(ticker, statement_type, quarterly)
-            if df is not None and not df.empty:
-                statement_dfs.append(df)
+        # Each statement is a separate blocking request, so fetch them together
+        get_statement = partial(
+            self._get_statement, ticker, quarterly=quarterly, metrics=metrics
+        )
+        with ThreadPoolExecutor(max_workers=len(statements) or 1) as executor:
+            results = executor.map(get_statement, statements)
+            statement_dfs = [df for df in results if df is not None and not df.empty]
 
         if not statement_dfs:
             return None
 
-        # Merge all statements on period (outer join to keep all periods)
-        result = statement_dfs[0]
-        for df in statement_dfs[1:]:
-            result = result.merge(df, on="period", how="outer")
+        # Align all statements on period in one pass (outer join to keep all
+        # periods)
+        result = pd.concat(statement_dfs, axis=1, join="outer", sort=True)
+        if result.columns.has_duplicates:
+            result = _coalesce_columns(result)
 
-        return result
+        return result.reset_index()
 
     def _get_statement(
         self,
         ticker: Any,
         statement_type: StatementType,
         quarterly: bool,
+        metrics: list[str] | None = None,
     ) -> pd.DataFrame | None:
-        """Get a single financial statement and transpose it."""
+        """Get a single financial statement transposed and indexed by period.
+
+        If metrics is given, only those rows of the statement are kept.
+        """
         try:
             if statement_type == StatementType.BALANCE_SHEET:
                 raw = (
@@ -188,19 +270,41 @@ class YFinanceExtractor(BaseExtractor):
             else:
                 return None
 
+            if raw is not None and metrics:
+                # Drop unwanted metrics before transposing and merging
+                raw = raw.loc[raw.index.intersection(metrics)]
+
             if raw is None or raw.empty:
                 return None
 
             # yfinance returns: rows=metrics, columns=periods (dates)
             # We want: rows=periods, columns=metrics
-            df = raw.T.reset_index()
-            df = df.rename(columns={"index": "period"})
+            df = raw.T
 
             # Ensure period is datetime
-            df["period"] = pd.to_datetime(df["period"])
+            df.index = pd.to_datetime(df.index)
+            df.index.name = "period"
+            # concat can't align on a repeated period, so keep its first report
+            if df.index.has_duplicates:
+                df = df[~df.index.duplicated()]
 
             return df
 
         except Exception as e:
             logger.warning("Failed to get %s: %s", statement_type.value, e)
             return None
+
+
+def _coalesce_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Merge columns sharing a name, taking the first non-null value per row.
+
+    A metric can appear in several statements; each may report periods the
+    others lack.
+    """
+    columns = {}
+    for name in df.columns.unique():
+        column = df[name]
+        if isinstance(column, pd.DataFrame):
+            column = column.bfill(axis=1).iloc[:, 0]
+        columns[name] = column
+    return pd.DataFrame(columns, index=df.index)
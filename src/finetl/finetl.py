@@ -94,6 +94,7 @@ class FinETL:
         loader_class = get_loader(self.config.loading.destination)
         loader = loader_class(self.config.loading)
         loader.load(data)
+        loader.wait()
 
         logger.info("Pipeline completed: %s", self.config.name)
 
@@ -1,12 +1,33 @@
-"""Loading module for FinETL."""
+"""Loading module for FinETL.
 
-from finetl.loading.csv import CSVLoader
-from finetl.loading.huggingface import HuggingFaceLoader
-from finetl.loading.parquet import ParquetLoader
-from finetl.loading.postgresql import PostgreSQLLoader
-from finetl.loading.registry import get_loader, register_loader
+Loader classes are imported on first access, so importing the package (or
+the registry) doesn't pull in the modules and dependencies of every
+destination.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from finetl.loading.registry import _loaders, get_loader, register_loader
+
+if TYPE_CHECKING:
+    from finetl.loading.arrow import ArrowIPCLoader
+    from finetl.loading.csv import CSVLoader
+    from finetl.loading.huggingface import HuggingFaceLoader
+    from finetl.loading.parquet import ParquetLoader
+    from finetl.loading.postgresql import PostgreSQLLoader
+
+# Module that defines each built-in loader class, taken from the registry's
+# "module:Class" paths before any register_loader call can replace them
+_LAZY_LOADERS = {
+    name: module
+    for module, _, name in (
+        path.partition(":") for path in _loaders.values() if isinstance(path, str)
+    )
+}
 
 __all__ = [
+    "ArrowIPCLoader",
     "CSVLoader",
     "HuggingFaceLoader",
     "ParquetLoader",
@@ -14,3 +35,15 @@ __all__ = [
     "get_loader",
     "register_loader",
 ]
+
+
+def __getattr__(name: str) -> type:
+    """Import a loader class the first time it is accessed."""
+    try:
+        module = _LAZY_LOADERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    loader_class = getattr(import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = loader_class
+    return loader_class
@@ -0,0 +1,23 @@
+"""Shared pandas to Arrow conversion for the loaders."""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+# Conversion copies each column block on its own thread; beyond a handful of
+# threads the copies are memory-bandwidth bound and extra threads only add
+# scheduling overhead
+_NTHREADS = min(8, os.cpu_count() or 1)
+
+
+def to_arrow(df: pd.DataFrame, schema: pa.Schema | None = None) -> pa.Table:
+    """Convert df to an Arrow table, dropping the index.
+
+    The index is never part of the written output, so it is not converted.
+    If schema is given, columns are converted to it instead of inferring
+    types from the data.
+    """
+    return pa.Table.from_pandas(
+        df, schema=schema, preserve_index=False, nthreads=_NTHREADS
+    )
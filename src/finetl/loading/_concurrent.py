@@ -0,0 +1,12 @@
+"""Concurrent execution of independent loader writes."""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_concurrently(*calls: Callable[[], None]) -> None:
+    """Run calls on separate threads, re-raising the first error once done."""
+    with ThreadPoolExecutor(max_workers=len(calls) or 1) as executor:
+        futures = [executor.submit(call) for call in calls]
+        for future in futures:
+            future.result()
@@ -0,0 +1,71 @@
+"""Shared base for loaders that write one file per table."""
+
+import logging
+from abc import abstractmethod
+from functools import partial
+from pathlib import Path
+from typing import ClassVar
+
+import pandas as pd
+
+from finetl.base import BaseLoader
+from finetl.config.schema import LoadingConfig
+from finetl.exceptions import LoadingError
+from finetl.loading._concurrent import run_concurrently
+from finetl.models import ExtractedData
+
+logger = logging.getLogger(__name__)
+
+
+class FileLoader(BaseLoader):
+    """Base class for loaders writing <table>.<suffix> files to a directory.
+
+    Tables are written concurrently and empty tables are skipped. Subclasses
+    set suffix and implement _write for their file format.
+    """
+
+    suffix: ClassVar[str]
+
+    def __init__(self, config: LoadingConfig) -> None:
+        super().__init__(config)
+        self.output_path = Path(config.path)
+        self._output_path_created = False
+
+    def load(self, data: ExtractedData) -> None:
+        """Write extracted data to files in the output directory."""
+        if not data:
+            logger.warning("No data to load")
+            return
+
+        self._ensure_output_path()
+
+        run_concurrently(
+            partial(self._write_table, data.ohlcv, "ohlcv", "OHLCV"),
+            partial(self._write_table, data.financials, "financials", "financials"),
+        )
+
+    def _ensure_output_path(self) -> None:
+        """Create the output directory on the first load that writes data."""
+        if self._output_path_created:
+            return
+        try:
+            self.output_path.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise LoadingError(f"Failed to create output directory: {e}") from e
+        self._output_path_created = True
+
+    def _write_table(self, df: pd.DataFrame | None, name: str, label: str) -> None:
+        """Write df to <name>.<suffix>; errors are raised as LoadingError."""
+        if df is None or len(df.index) == 0:
+            return
+
+        path = self.output_path / f"{name}.{self.suffix}"
+        logger.info("Writing %s data to %s", label, path)
+        try:
+            self._write(df, path)
+        except Exception as e:
+            raise LoadingError(f"Failed to write {label} data: {e}") from e
+
+    @abstractmethod
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        """Write df to path in the loader's file format."""
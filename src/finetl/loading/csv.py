@@ -1,49 +1,142 @@
 """CSV data loader."""
 
-import logging
+import re
 from pathlib import Path
 
-from finetl.base import BaseLoader
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
 from finetl.config.schema import LoadingConfig
-from finetl.exceptions import LoadingError
-from finetl.models import ExtractedData
+from finetl.loading._arrow import to_arrow
+from finetl.loading._file import FileLoader
+
+# Characters that make DataFrame.to_csv quote a field
+_NEEDS_QUOTING = r'[,"\r\n]'
+
+# Coarsest timestamp units to try, matching the precision pandas prints
+_TIMESTAMP_UNITS = ("s", "ms", "us")
+
+
+def _csv_table(df: pd.DataFrame) -> pa.Table:
+    """Convert df to Arrow with dates and booleans formatted as to_csv would.
+
+    Arrow writes timestamps with nanoseconds and booleans in lower case, so
+    those columns are cast here. Floats are left to Arrow.
+    """
+    table = to_arrow(df)
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if pa.types.is_timestamp(field.type):
+            if field.type.tz is None:
+                column = _cast_timestamps(df.iloc[:, i], column)
+            else:
+                column = _format_tz_timestamps(df.iloc[:, i])
+        elif pa.types.is_boolean(field.type):
+            column = pc.if_else(column, "True", "False")
+        else:
+            continue
+        table = table.set_column(i, field.name, column)
+    return table
+
+
+def _cast_timestamps(series: pd.Series, column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Cast column to dates, or to the coarsest unit that loses no precision."""
+    missing = series.isna()
+    if (missing | (series.dt.normalize() == series)).all():
+        return column.cast(pa.date32())
+    for unit in _TIMESTAMP_UNITS:
+        if (missing | (series.dt.floor(unit) == series)).all():
+            return column.cast(pa.timestamp(unit))
+    return column
+
 
-logger = logging.getLogger(__name__)
+def _format_tz_timestamps(series: pd.Series) -> pa.Array:
+    """Format tz-aware timestamps like pandas, e.g. 2024-01-02 14:30:00+00:00.
 
+    pandas prints each value's local time with microseconds only where they
+    are non-zero, then its UTC offset.
+    """
+    local = series.dt.tz_localize(None)
+    wall = pa.array(local)
+    seconds = pc.cast(wall, pa.timestamp("s"), safe=False).cast(pa.string())
 
-class CSVLoader(BaseLoader):
-    """Loader for writing data to CSV files."""
+    fraction = pc.add(
+        pc.multiply(pc.millisecond(wall), 1000), pc.microsecond(wall)
+    ).cast(pa.int64())
+    digits = 6
+    if pc.any(pc.not_equal(pc.nanosecond(wall), 0)).as_py():
+        fraction = pc.add(pc.multiply(fraction, 1000), pc.nanosecond(wall))
+        digits = 9
+    fraction = pc.if_else(
+        pc.equal(fraction, 0),
+        "",
+        pc.binary_join_element_wise(
+            ".", pc.utf8_lpad(fraction.cast(pa.string()), digits, "0"), ""
+        ),
+    )
+
+    # Offsets only take a few distinct values, so format each one once
+    minutes = (local - series.dt.tz_convert("UTC").dt.tz_localize(None)) // (
+        pd.Timedelta(minutes=1)
+    )
+    codes, uniques = pd.factorize(minutes)
+    labels = [
+        f"{'-' if m < 0 else '+'}{abs(int(m)) // 60:02d}:{abs(int(m)) % 60:02d}"
+        for m in uniques
+    ]
+    offsets = pa.array(labels, pa.string()).take(pa.array(codes, mask=codes < 0))
+
+    return pc.binary_join_element_wise(seconds, fraction, offsets, "")
+
+
+def _needs_quoting(table: pa.Table) -> bool:
+    """Return True if any column name or string value has to be quoted."""
+    if any(re.search(_NEEDS_QUOTING, name) for name in table.column_names):
+        return True
+    for column in table.columns:
+        if pa.types.is_dictionary(column.type):
+            values = [chunk.dictionary for chunk in column.chunks]
+        else:
+            values = column.chunks
+        for chunk in values:
+            if not (
+                pa.types.is_string(chunk.type) or pa.types.is_large_string(chunk.type)
+            ):
+                continue
+            if pc.any(pc.match_substring_regex(chunk, _NEEDS_QUOTING)).as_py():
+                return True
+    return False
+
+
+class CSVLoader(FileLoader):
+    """Loader for writing data to CSV files.
+
+    Files are serialized by Arrow's multi-threaded C++ CSV writer. Dates,
+    timestamps and booleans read as DataFrame.to_csv writes them, but floats
+    keep Arrow's shortest round-trip form (185, 3.5e+11 rather than 185.0,
+    350000000000.0). Arrow cannot quote only the values that need it, so
+    frames with such values (a comma in a string, say) are written by
+    pandas instead.
+    """
+
+    suffix = "csv"
 
     def __init__(self, config: LoadingConfig) -> None:
         super().__init__(config)
-        self.output_path = Path(config.path)
+        self._write_options = pacsv.WriteOptions(
+            batch_size=config.csv_batch_size,
+            quoting_style="none",
+            # Arrow always quotes header names, so the header is written here
+            include_header=False,
+        )
 
-    def load(self, data: ExtractedData) -> None:
-        """Write extracted data to CSV files."""
-        if not data:
-            logger.warning("No data to load")
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        table = _csv_table(df)
+        if _needs_quoting(table):
+            df.to_csv(path, index=False)
             return
-
-        # Create output directory if it doesn't exist
-        try:
-            self.output_path.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise LoadingError(f"Failed to create output directory: {e}") from e
-
-        # Write OHLCV data
-        if data.ohlcv is not None and not data.ohlcv.empty:
-            ohlcv_path = self.output_path / "ohlcv.csv"
-            logger.info("Writing OHLCV data to %s", ohlcv_path)
-            try:
-                data.ohlcv.to_csv(ohlcv_path, index=False)
-            except Exception as e:
-                raise LoadingError(f"Failed to write OHLCV data: {e}") from e
-
-        # Write financials data
-        if data.financials is not None and not data.financials.empty:
-            financials_path = self.output_path / "financials.csv"
-            logger.info("Writing financials data to %s", financials_path)
-            try:
-                data.financials.to_csv(financials_path, index=False)
-            except Exception as e:
-                raise LoadingError(f"Failed to write financials data: {e}") from e
+        with pa.OSFile(str(path), "wb") as sink:
+            sink.write((",".join(table.column_names) + "\n").encode())
+            pacsv.write_csv(table, sink, self._write_options)
@@ -1,53 +1,112 @@
 """HuggingFace Hub data loader."""
 
+import importlib.util
 import logging
-
-from datasets import Dataset, DatasetDict
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from finetl.base import BaseLoader
 from finetl.config.schema import LoadingConfig
 from finetl.exceptions import LoadingError
+from finetl.loading._arrow import to_arrow
 from finetl.models import ExtractedData
 
+if TYPE_CHECKING:
+    from datasets import DatasetDict
+
 logger = logging.getLogger(__name__)
 
 
+def _enable_fast_upload() -> None:
+    """Switch huggingface_hub to its fastest available upload backend.
+
+    huggingface_hub < 1.0 uploads through the Rust hf_transfer client when it
+    is installed (pip install hf_transfer). Newer releases upload through
+    hf_xet, whose high-performance mode is enabled by an environment variable.
+    Settings made explicitly by the user are left alone.
+    """
+    from huggingface_hub import constants as hf_constants
+
+    if not hasattr(hf_constants, "HF_HUB_ENABLE_HF_TRANSFER"):
+        os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+        return
+
+    user_set = "HF_HUB_ENABLE_HF_TRANSFER" in os.environ
+    if not user_set and importlib.util.find_spec("hf_transfer") is not None:
+        hf_constants.HF_HUB_ENABLE_HF_TRANSFER = True
+
+
 class HuggingFaceLoader(BaseLoader):
-    """Loader for uploading data to HuggingFace Hub as datasets."""
+    """Loader for uploading data to HuggingFace Hub as datasets.
+
+    Uploads run in a background thread so the caller can carry on with other
+    work. Call wait() to block until the upload finishes and surface errors.
+    """
 
     def __init__(self, config: LoadingConfig) -> None:
         super().__init__(config)
         self.repo_id = config.repo_id
         self.private = config.private
+        self.fast_upload = config.fast_upload
+        self.num_proc = config.num_proc
+        self._executor: ThreadPoolExecutor | None = None
+        self._upload_future: Future[None] | None = None
 
     def load(self, data: ExtractedData) -> None:
-        """Upload extracted data to HuggingFace Hub."""
+        """Start uploading extracted data to HuggingFace Hub."""
         if not data:
             logger.warning("No data to load")
             return
 
+        # datasets takes several seconds to import, so only pay for it when
+        # uploading to the Hub
+        from datasets import Dataset, DatasetDict
+
         datasets: dict[str, Dataset] = {}
 
         # Convert OHLCV DataFrame to Dataset
-        if data.ohlcv is not None and not data.ohlcv.empty:
+        if data.has_ohlcv:
             logger.info("Converting OHLCV data to HuggingFace Dataset")
-            datasets["ohlcv"] = Dataset.from_pandas(data.ohlcv)
+            datasets["ohlcv"] = Dataset(to_arrow(data.ohlcv))
 
         # Convert financials DataFrame to Dataset
-        if data.financials is not None and not data.financials.empty:
+        if data.has_financials:
             logger.info("Converting financials data to HuggingFace Dataset")
-            datasets["financials"] = Dataset.from_pandas(data.financials)
+            datasets["financials"] = Dataset(to_arrow(data.financials))
 
         if not datasets:
             logger.warning("No datasets to upload")
             return
 
-        # Create DatasetDict and push to Hub
+        # Only one upload to the repo at a time
+        self.wait()
+
+        # Create DatasetDict and push to Hub in the background
         dataset_dict = DatasetDict(datasets)
         logger.info("Pushing dataset to HuggingFace Hub: %s", self.repo_id)
 
+        if self.fast_upload:
+            _enable_fast_upload()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._upload_future = self._executor.submit(self._push, dataset_dict)
+
+    def wait(self) -> None:
+        """Block until the pending upload, if any, has finished."""
+        future, self._upload_future = self._upload_future, None
+        if future is None:
+            return
+
         try:
-            dataset_dict.push_to_hub(self.repo_id, private=self.private)
-            logger.info("Successfully uploaded dataset to %s", self.repo_id)
+            future.result()
         except Exception as e:
             raise LoadingError(f"Failed to upload to HuggingFace Hub: {e}") from e
+
+    def _push(self, dataset_dict: "DatasetDict") -> None:
+        """Push a DatasetDict to the Hub."""
+        dataset_dict.push_to_hub(
+            self.repo_id, private=self.private, num_proc=self.num_proc
+        )
+        logger.info("Successfully uploaded dataset to %s", self.repo_id)
@@ -1,49 +1,47 @@
 """Parquet data loader."""
 
-import logging
 from pathlib import Path
 
-from finetl.base import BaseLoader
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from finetl.config.schema import LoadingConfig
-from finetl.exceptions import LoadingError
-from finetl.models import ExtractedData
+from finetl.loading._arrow import to_arrow
+from finetl.loading._file import FileLoader
+
+# zstd (the config default) compresses the numeric OHLCV/financials columns
+# much better than snappy, and the repetitive ticker/date columns
+# dictionary-encode well
+_ZSTD_LEVEL = 3
+
 
-logger = logging.getLogger(__name__)
+class ParquetLoader(FileLoader):
+    """Loader for writing data to Parquet files.
 
+    Frames are converted to Arrow and written one row group at a time, so
+    only a single row group's Arrow copy is held in memory alongside the
+    DataFrame.
+    """
 
-class ParquetLoader(BaseLoader):
-    """Loader for writing data to Parquet files."""
+    suffix = "parquet"
 
     def __init__(self, config: LoadingConfig) -> None:
         super().__init__(config)
-        self.output_path = Path(config.path)
-
-    def load(self, data: ExtractedData) -> None:
-        """Write extracted data to Parquet files."""
-        if not data:
-            logger.warning("No data to load")
-            return
-
-        # Create output directory if it doesn't exist
-        try:
-            self.output_path.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise LoadingError(f"Failed to create output directory: {e}") from e
-
-        # Write OHLCV data
-        if data.ohlcv is not None and not data.ohlcv.empty:
-            ohlcv_path = self.output_path / "ohlcv.parquet"
-            logger.info("Writing OHLCV data to %s", ohlcv_path)
-            try:
-                data.ohlcv.to_parquet(ohlcv_path, index=False)
-            except Exception as e:
-                raise LoadingError(f"Failed to write OHLCV data: {e}") from e
-
-        # Write financials data
-        if data.financials is not None and not data.financials.empty:
-            financials_path = self.output_path / "financials.parquet"
-            logger.info("Writing financials data to %s", financials_path)
-            try:
-                data.financials.to_parquet(financials_path, index=False)
-            except Exception as e:
-                raise LoadingError(f"Failed to write financials data: {e}") from e
+        self.compression = config.compression
+        self.row_group_size = config.row_group_size
+        self._writer_options = {
+            "compression": self.compression,
+            "compression_level": _ZSTD_LEVEL if self.compression == "zstd" else None,
+            "use_dictionary": True,
+            "data_page_size": 1 << 20,
+        }
+
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        with pq.ParquetWriter(path, schema, **self._writer_options) as writer:
+            for start in range(0, len(df.index), self.row_group_size):
+                chunk = df.iloc[start : start + self.row_group_size]
+                writer.write_table(
+                    to_arrow(chunk, schema), row_group_size=self.row_group_size
+                )
@@ -1,21 +1,160 @@
 """PostgreSQL data loader."""
 
+import atexit
+import importlib.util
 import logging
-from urllib.parse import quote_plus
+import threading
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from pandas.io.sql import SQLTable
 
 from finetl.base import BaseLoader
 from finetl.config.schema import LoadingConfig
 from finetl.exceptions import LoadingError
+from finetl.loading._arrow import to_arrow
+from finetl.loading._concurrent import run_concurrently
 from finetl.models import ExtractedData
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine import URL, Connection, Engine
+
 logger = logging.getLogger(__name__)
 
+# Multi-row INSERTs bind one parameter per value; stay well under the
+# server's limit on parameters per statement
+_MAX_BIND_PARAMS = 30000
+
+# Default rows per multi-row INSERT when COPY is disabled
+_DEFAULT_INSERT_CHUNKSIZE = 10_000
+
+# Rows encoded per CSV batch streamed into COPY
+_COPY_BATCH_ROWS = 100_000
+
+# Natural key of each table, which upserts use as the conflict target
+_UPSERT_KEYS = {"ohlcv": ("ticker", "date"), "financials": ("ticker", "period")}
+
+# Nulls are written as unquoted empty fields, which COPY's CSV format reads
+# as NULL; strings are always quoted so "" stays an empty string
+_CSV_OPTIONS = pacsv.WriteOptions(include_header=False)
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a PostgreSQL identifier, e.g. a metric name containing spaces."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _qualified_name(name: str, schema: str | None) -> str:
+    """Return the quoted, optionally schema-qualified name of a table."""
+    if schema:
+        return f"{_quote_ident(schema)}.{_quote_ident(name)}"
+    return _quote_ident(name)
+
+
+def _csv_batches(df: pd.DataFrame) -> Iterator[bytes]:
+    """Yield df encoded as header-less CSV, _COPY_BATCH_ROWS rows at a time."""
+    # Infer the schema once rather than per batch; it also keeps column
+    # types the same across batches
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for start in range(0, len(df.index), _COPY_BATCH_ROWS):
+        batch = to_arrow(df.iloc[start : start + _COPY_BATCH_ROWS], schema)
+        out = pa.BufferOutputStream()
+        pacsv.write_csv(batch, out, _CSV_OPTIONS)
+        yield out.getvalue().to_pybytes()
+
+
+class _ChunkReader:
+    """Read-only file-like object over an iterator of byte chunks.
+
+    copy_expert pulls the COPY payload through read(), so chunks are only
+    encoded as the server consumes them.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = b""
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            rest = b"".join([self._chunk[self._pos :], *self._chunks])
+            self._chunk, self._pos = b"", 0
+            return rest
+        if self._pos >= len(self._chunk):
+            self._chunk, self._pos = next(self._chunks, b""), 0
+        data = self._chunk[self._pos : self._pos + size]
+        self._pos += len(data)
+        return data
+
+
+def _copy_insert(
+    table: SQLTable,
+    conn: "Connection",
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """Insert rows for DataFrame.to_sql with a single COPY FROM STDIN.
+
+    to_sql still creates or replaces the table according to if_exists; only
+    the row inserts are replaced, which otherwise go one INSERT per row.
+    Without a chunksize to_sql calls this once for the whole frame, so the
+    COPY payload is encoded from table.frame by Arrow's CSV writer rather
+    than from the boxed Python rows in data_iter. It is encoded in batches
+    while streaming, so only one batch of CSV is held in memory.
+    """
+    buf = _ChunkReader(_csv_batches(table.frame[keys]))
+
+    target = _qualified_name(table.name, table.schema)
+    columns = ", ".join(_quote_ident(key) for key in keys)
+
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT CSV)", buf)
+        return cur.rowcount
+
+
+def _binary_copy_insert(
+    table: SQLTable,
+    conn: "Connection",
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int | None:
+    """Insert rows for DataFrame.to_sql with a binary COPY through pgcopy.
+
+    Numbers and timestamps are sent in PostgreSQL's binary format instead of
+    being formatted as text and parsed again by the server. pgcopy encodes
+    each value in Python, but streams the payload to the server through a
+    pipe as rows are encoded rather than buffering the whole table. Tables
+    with a column type pgcopy cannot encode fall back to a CSV COPY.
+    """
+    from pgcopy import CopyManager
+
+    target = f"{table.schema}.{table.name}" if table.schema else table.name
+    try:
+        # Looks up the column types, before any rows are consumed
+        manager = CopyManager(conn.connection.dbapi_connection, target, keys)
+    except TypeError as e:
+        logger.debug("Binary COPY unavailable for %s, using CSV: %s", target, e)
+        return _copy_insert(table, conn, keys, data_iter)
+
+    manager.threading_copy(data_iter)
+    return None
+
 
 class PostgreSQLLoader(BaseLoader):
-    """Loader for writing data to PostgreSQL database."""
+    """Loader for writing data to PostgreSQL database.
+
+    Engines are shared by every loader with the same connection URL, so
+    later loads, including those of new loader instances, reuse the pooled
+    connections. Pools are disposed at interpreter exit, or earlier by
+    close().
+    """
+
+    _engines: ClassVar[dict["URL", "Engine"]] = {}
+    _engines_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, config: LoadingConfig) -> None:
         super().__init__(config)
@@ -26,68 +165,177 @@ class PostgreSQLLoader(BaseLoader):
         self.user = config.user
         self.password = config.password
         self.if_exists = config.if_exists.value
+        self.binary_copy = config.binary_copy
+        self.use_copy = config.use_copy
+        self.chunksize = config.chunksize
+        self.upsert = config.upsert
+
+        # sqlalchemy is only imported once a PostgreSQL loader is created,
+        # so pipelines writing elsewhere don't pay for importing it
+        from sqlalchemy.engine import URL
+
+        # URL.create escapes credentials itself, e.g. special characters
+        self._url = URL.create(
+            "postgresql+psycopg2",
+            username=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+        )
 
-    def _create_engine(self) -> Engine:
+    def _create_engine(self) -> "Engine":
         """Create SQLAlchemy engine for PostgreSQL connection."""
-        # URL-encode password to handle special characters
-        encoded_password = quote_plus(self.password)
-        connection_string = (
-            f"postgresql://{self.user}:{encoded_password}"
-            f"@{self.host}:{self.port}/{self.database}"
+        from sqlalchemy import create_engine
+
+        return create_engine(
+            self._url,
+            pool_size=10,
+            max_overflow=5,
+            # Reused connections may have been dropped by the server
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            # Batch executemany() INSERTs into multi-row statements
+            executemany_mode="values_plus_batch",
         )
-        return create_engine(connection_string)
 
-    def load(self, data: ExtractedData) -> None:
-        """Write extracted data to PostgreSQL tables."""
-        if not data:
-            logger.warning("No data to load")
-            return
+    def _get_engine(self) -> "Engine":
+        """Return the shared engine for this loader's URL, creating it once."""
+        with self._engines_lock:
+            engine = self._engines.get(self._url)
+            if engine is None:
+                engine = self._engines[self._url] = self._create_engine()
+        return engine
 
-        has_ohlcv = data.ohlcv is not None and not data.ohlcv.empty
-        has_financials = data.financials is not None and not data.financials.empty
+    def close(self) -> None:
+        """Dispose of the engine for this loader's URL and its connections."""
+        with self._engines_lock:
+            engine = self._engines.pop(self._url, None)
+        if engine is not None:
+            engine.dispose()
 
-        if not has_ohlcv and not has_financials:
-            logger.warning("No data to load")
+    @classmethod
+    def _dispose_engines(cls) -> None:
+        """Dispose of every shared engine."""
+        with cls._engines_lock:
+            engines = list(cls._engines.values())
+            cls._engines.clear()
+        for engine in engines:
+            engine.dispose()
+
+    def _insert_options(self, df: pd.DataFrame) -> dict[str, Any]:
+        """Return the to_sql insert options for writing df.
+
+        COPY is used unless disabled, preferring binary COPY. Without COPY,
+        rows are sent as multi-row INSERTs of the configured chunksize,
+        capped so a statement stays within the bind parameter limit.
+        """
+        if not self.use_copy:
+            max_rows = max(1, _MAX_BIND_PARAMS // max(1, len(df.columns)))
+            chunksize = min(self.chunksize or _DEFAULT_INSERT_CHUNKSIZE, max_rows)
+            return {"method": "multi", "chunksize": chunksize}
+        if self.binary_copy and importlib.util.find_spec("pgcopy") is not None:
+            return {"method": _binary_copy_insert}
+        return {"method": _copy_insert}
+
+    def _write_table(
+        self,
+        engine: "Engine",
+        df: pd.DataFrame | None,
+        name: str,
+        label: str,
+    ) -> None:
+        """Write df to the table name, as FileLoader._write_table does."""
+        if df is None or len(df.index) == 0:
             return
 
+        logger.info(
+            "Writing %s data to PostgreSQL table %s.%s", label, self.schema_name, name
+        )
         try:
-            engine = self._create_engine()
-        except Exception as e:
-            raise LoadingError(f"Failed to create database connection: {e}") from e
-
-        # Write OHLCV data
-        if has_ohlcv:
-            logger.info(
-                "Writing OHLCV data to PostgreSQL table %s.ohlcv",
-                self.schema_name,
-            )
-            try:
-                data.ohlcv.to_sql(
-                    name="ohlcv",
+            if self.upsert:
+                self._upsert_table(engine, df, name)
+            else:
+                df.to_sql(
+                    name=name,
                     con=engine,
                     schema=self.schema_name,
                     if_exists=self.if_exists,
                     index=False,
+                    **self._insert_options(df),
                 )
-            except Exception as e:
-                raise LoadingError(f"Failed to write OHLCV data: {e}") from e
-
-        # Write financials data
-        if has_financials:
-            logger.info(
-                "Writing financials data to PostgreSQL table %s.financials",
-                self.schema_name,
-            )
-            try:
-                data.financials.to_sql(
-                    name="financials",
-                    con=engine,
+        except Exception as e:
+            raise LoadingError(f"Failed to write {label} data: {e}") from e
+
+    def _upsert_table(self, engine: "Engine", df: pd.DataFrame, name: str) -> None:
+        """Upsert df into the table name in a single transaction.
+
+        Rows are loaded into a temporary staging table the same way other
+        writes are (COPY, or multi-row INSERTs when use_copy is off) and
+        moved into the target with one INSERT ... ON CONFLICT DO NOTHING on
+        the table's natural key. A table created here gets a primary key on
+        that key; an existing table must already have a primary key or
+        unique constraint on those columns.
+        """
+        from sqlalchemy import inspect
+
+        target = _qualified_name(name, self.schema_name)
+        # Temporary tables live in their own schema and can't be qualified
+        staging = f"_finetl_staging_{name}"
+        columns = ", ".join(_quote_ident(col) for col in df.columns)
+        key = ", ".join(_quote_ident(col) for col in _UPSERT_KEYS[name])
+
+        # exec_driver_sql sends statements as-is, so column names containing
+        # colons or percent signs aren't taken for bind parameters
+        with engine.begin() as conn:
+            exists = inspect(conn).has_table(name, schema=self.schema_name)
+            if not exists or self.if_exists != "append":
+                # Create the empty table, or replace it or fail per if_exists
+                df.head(0).to_sql(
+                    name=name,
+                    con=conn,
                     schema=self.schema_name,
                     if_exists=self.if_exists,
                     index=False,
                 )
-            except Exception as e:
-                raise LoadingError(f"Failed to write financials data: {e}") from e
+                conn.exec_driver_sql(f"ALTER TABLE {target} ADD PRIMARY KEY ({key})")
+            conn.exec_driver_sql(
+                f"CREATE TEMPORARY TABLE {_quote_ident(staging)} (LIKE {target}) "
+                "ON COMMIT DROP"
+            )
+            df.to_sql(
+                name=staging,
+                con=conn,
+                if_exists="append",
+                index=False,
+                **self._insert_options(df),
+            )
+            conn.exec_driver_sql(
+                f"INSERT INTO {target} ({columns}) "
+                f"SELECT {columns} FROM {_quote_ident(staging)} "
+                f"ON CONFLICT ({key}) DO NOTHING"
+            )
+
+    def load(self, data: ExtractedData) -> None:
+        """Write extracted data to PostgreSQL tables."""
+        if not data:
+            logger.warning("No data to load")
+            return
+
+        try:
+            engine = self._get_engine()
+        except Exception as e:
+            raise LoadingError(f"Failed to create database connection: {e}") from e
+
+        # Each to_sql call checks out its own connection from the pool
+        run_concurrently(
+            partial(self._write_table, engine, data.ohlcv, "ohlcv", "OHLCV"),
+            partial(
+                self._write_table, engine, data.financials, "financials", "financials"
+            ),
+        )
 
-        engine.dispose()
         logger.info("Successfully wrote data to PostgreSQL")
+
+
+atexit.register(PostgreSQLLoader._dispose_engines)
@@ -1,21 +1,31 @@
 """Loader registry for mapping destination types to loader classes."""
 
+from collections.abc import Mapping
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType
+
 from finetl.base import BaseLoader
 from finetl.exceptions import ConfigurationError
-from finetl.loading.csv import CSVLoader
-from finetl.loading.huggingface import HuggingFaceLoader
-from finetl.loading.parquet import ParquetLoader
-from finetl.loading.postgresql import PostgreSQLLoader
-
-# Registry mapping destination type strings to loader classes
-_LOADER_REGISTRY: dict[str, type[BaseLoader]] = {
-    "csv": CSVLoader,
-    "parquet": ParquetLoader,
-    "huggingface": HuggingFaceLoader,
-    "postgresql": PostgreSQLLoader,
+
+# Registry mapping destination type strings to loader classes, or to
+# "module:Class" paths for built-in loaders that are imported on first use;
+# only register_loader writes to _loaders, everything else reads the
+# read-only view
+_loaders: dict[str, type[BaseLoader] | str] = {
+    "csv": "finetl.loading.csv:CSVLoader",
+    "parquet": "finetl.loading.parquet:ParquetLoader",
+    "huggingface": "finetl.loading.huggingface:HuggingFaceLoader",
+    "postgresql": "finetl.loading.postgresql:PostgreSQLLoader",
+    "arrow": "finetl.loading.arrow:ArrowIPCLoader",
 }
+_LOADER_REGISTRY: Mapping[str, type[BaseLoader] | str] = MappingProxyType(_loaders)
+
+# Supported destinations for error messages, kept in step by register_loader
+_supported = ", ".join(_loaders)
 
 
+@cache
 def get_loader(destination: str) -> type[BaseLoader]:
     """Get a loader class by destination type.
 
@@ -28,13 +38,16 @@ def get_loader(destination: str) -> type[BaseLoader]:
     Raises:
         ConfigurationError: If the destination type is not supported
     """
-    loader_class = _LOADER_REGISTRY.get(destination)
-    if loader_class is None:
-        supported = ", ".join(_LOADER_REGISTRY.keys())
+    try:
+        loader = _LOADER_REGISTRY[destination]
+    except KeyError:
         raise ConfigurationError(
-            f"Unsupported destination type: {destination}. Supported: {supported}"
-        )
-    return loader_class
+            f"Unsupported destination type: {destination}. Supported: {_supported}"
+        ) from None
+    if isinstance(loader, str):
+        module, _, name = loader.partition(":")
+        loader = getattr(import_module(module), name)
+    return loader
 
 
 def register_loader(destination: str, loader_class: type[BaseLoader]) -> None:
@@ -44,4 +57,8 @@ def register_loader(destination: str, loader_class: type[BaseLoader]) -> None:
         destination: The destination type string
         loader_class: The loader class to register
     """
-    _LOADER_REGISTRY[destination] = loader_class
+    global _supported
+    _loaders[destination] = loader_class
+    _supported = ", ".join(_loaders)
+    # Drop cached lookups, which may include an overridden destination
+    get_loader.cache_clear()
@@ -19,8 +19,16 @@ class ExtractedData:
     ohlcv: pd.DataFrame | None = None
     financials: pd.DataFrame | None = None
 
+    @property
+    def has_ohlcv(self) -> bool:
+        """Return True if OHLCV data with at least one row is present."""
+        return self.ohlcv is not None and len(self.ohlcv.index) > 0
+
+    @property
+    def has_financials(self) -> bool:
+        """Return True if financials data with at least one row is present."""
+        return self.financials is not None and len(self.financials.index) > 0
+
     def __bool__(self) -> bool:
         """Return True if any data is present."""
-        has_ohlcv = self.ohlcv is not None and not self.ohlcv.empty
-        has_financials = self.financials is not None and not self.financials.empty
-        return has_ohlcv or has_financials
+        return self.has_ohlcv or self.has_financials
@@ -1,6 +1,7 @@
 """Shared test fixtures."""
 
 from datetime import date
+from pathlib import Path
 
 import pandas as pd
 import pytest
@@ -18,6 +19,22 @@ from finetl.config.schema import (
 from finetl.models import ExtractedData
 
 
+@pytest.fixture(autouse=True)
+def config_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep config sidecar caches out of the user's home directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("FINETL_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def output_dir(tmp_path: Path) -> Path:
+    """Existing output directory for loaders to write files to."""
+    path = tmp_path / "output"
+    path.mkdir()
+    return path
+
+
 @pytest.fixture
 def sample_ohlcv_config() -> OHLCVConfig:
     """Sample OHLCV configuration."""
@@ -85,7 +102,8 @@ def sample_ohlcv_df() -> pd.DataFrame:
     """Sample OHLCV DataFrame."""
     return pd.DataFrame(
         {
-            "ticker": ["AAPL", "AAPL", "MSFT", "MSFT"],
+            # Tickers are categorical, as produced by the extractor
+            "ticker": pd.Categorical(["AAPL", "AAPL", "MSFT", "MSFT"]),
             "date": pd.to_datetime(
                 ["2024-01-02", "2024-01-03", "2024-01-02", "2024-01-03"]
             ),
@@ -103,7 +121,7 @@ def sample_financials_df() -> pd.DataFrame:
     """Sample financials DataFrame."""
     return pd.DataFrame(
         {
-            "ticker": ["AAPL", "AAPL", "MSFT"],
+            "ticker": pd.Categorical(["AAPL", "AAPL", "MSFT"]),
             "period": pd.to_datetime(["2024-09-30", "2024-06-30", "2024-06-30"]),
             "Total Assets": [352583000000, 348000000000, 512163000000],
             "Total Liabilities": [308030000000, 305000000000, 243686000000],
@@ -1,7 +1,10 @@
 """Tests for configuration parsing and validation."""
 
+import json
+import os
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -18,6 +21,7 @@ from finetl.config import (
     load_config,
     parse_config,
 )
+from finetl.config.loader import _load_config_cached
 from finetl.exceptions import ConfigurationError
 
 
@@ -138,6 +142,21 @@ class TestExtractionConfig:
         )
         assert config.source == "yfinance"
         assert config.tickers == ["AAPL", "MSFT"]
+        assert config.max_workers == 8
+
+    def test_invalid_max_workers_raises(self):
+        with pytest.raises(ValueError):
+            ExtractionConfig(
+                source="yfinance",
+                tickers=["AAPL"],
+                data_types=DataTypesConfig(
+                    ohlcv=OHLCVConfig(
+                        start_date=date(2024, 1, 1),
+                        end_date=date(2024, 12, 1),
+                    )
+                ),
+                max_workers=0,
+            )
 
     def test_empty_tickers_raises(self):
         with pytest.raises(ValueError):
@@ -186,6 +205,112 @@ class TestLoadConfig:
         config = load_config(config_path)
         assert config.name == "test-pipeline"
 
+    def test_load_cached_returns_copy(self, tmp_path: Path, sample_config_dict: dict):
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        first = load_config(config_path)
+        first.name = "mutated"
+        second = load_config(config_path)
+
+        assert second.name == "test-pipeline"
+        assert second is not first
+
+    def test_load_reloads_modified_file(self, tmp_path: Path, sample_config_dict: dict):
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        assert load_config(config_path).name == "test-pipeline"
+
+        sample_config_dict["name"] = "renamed-pipeline"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+        assert load_config(config_path).name == "renamed-pipeline"
+
+    def test_load_uses_json_sidecar(
+        self, tmp_path: Path, sample_config_dict: dict, config_cache_dir: Path
+    ):
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        first = load_config(config_path)
+        sidecars = list(config_cache_dir.glob("config-*.json"))
+        assert len(sidecars) == 1
+        assert sidecars[0].stat().st_mode & 0o777 == 0o600
+
+        # A fresh process has an empty in-memory cache; YAML must not be read
+        _load_config_cached.cache_clear()
+        with patch("finetl.config.loader.load_yaml") as mock_load_yaml:
+            second = load_config(config_path)
+
+        mock_load_yaml.assert_not_called()
+        assert second == first
+
+    def test_sidecar_stores_only_set_fields(
+        self, tmp_path: Path, sample_config_dict: dict, config_cache_dir: Path
+    ):
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        load_config(config_path)
+
+        sidecar = next(config_cache_dir.glob("config-*.json"))
+        body = json.loads(sidecar.read_text().partition("\n")[2])
+        assert "row_group_size" not in body["loading"]
+
+    def test_sidecar_permissions_reset(
+        self, tmp_path: Path, sample_config_dict: dict, config_cache_dir: Path
+    ):
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        load_config(config_path)
+        sidecar = next(config_cache_dir.glob("config-*.json"))
+        sidecar.chmod(0o644)
+
+        _load_config_cached.cache_clear()
+        os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+        load_config(config_path)
+
+        assert sidecar.stat().st_mode & 0o777 == 0o600
+
+    def test_sidecar_not_written_with_password(
+        self, tmp_path: Path, sample_config_dict: dict, config_cache_dir: Path
+    ):
+        sample_config_dict["loading"] = {
+            "destination": "postgresql",
+            "host": "localhost",
+            "database": "finetl",
+            "user": "etl",
+            "password": "secret",
+        }
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        assert load_config(config_path).loading.password == "secret"
+        assert not list(config_cache_dir.glob("config-*.json"))
+
+    def test_load_ignores_corrupt_sidecar(
+        self, tmp_path: Path, sample_config_dict: dict, config_cache_dir: Path
+    ):
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        load_config(config_path)
+
+        sidecar = next(config_cache_dir.glob("config-*.json"))
+        mtime_ns = config_path.stat().st_mtime_ns
+        sidecar.write_text(f"{mtime_ns}\n{{not json")
+        _load_config_cached.cache_clear()
+
+        assert load_config(config_path).name == "test-pipeline"
+
     def test_load_nonexistent_file(self, tmp_path: Path):
         with pytest.raises(ConfigurationError, match="Config file not found"):
             load_config(tmp_path / "nonexistent.yaml")
@@ -11,9 +11,11 @@ from finetl.config.schema import (
     ExtractionConfig,
     FinancialsConfig,
     Frequency,
+    Interval,
     OHLCVConfig,
     StatementType,
 )
+from finetl.exceptions import ExtractionError
 from finetl.extraction import YFinanceExtractor
 
 
@@ -88,8 +90,8 @@ class TestYFinanceExtractor:
         )
         extractor = YFinanceExtractor(config)
 
-        with patch("finetl.extraction.yfinance.yf.download") as mock_download:
-            mock_download.return_value = mock_ohlcv_data
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value.history.return_value = mock_ohlcv_data
 
             result = extractor.extract()
 
@@ -113,19 +115,136 @@ class TestYFinanceExtractor:
         )
         extractor = YFinanceExtractor(config)
 
-        # Create multi-ticker response
-        multi_data = pd.concat(
-            {"AAPL": mock_ohlcv_data, "MSFT": mock_ohlcv_data},
-            axis=1,
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value.history.return_value = mock_ohlcv_data
+
+            result = extractor.extract()
+
+        # One request per ticker
+        called_symbols = {c.args[0] for c in mock_yf_ticker.call_args_list}
+        assert called_symbols == {"AAPL", "MSFT"}
+
+        assert result.ohlcv is not None
+        assert set(result.ohlcv["ticker"].unique()) == {"AAPL", "MSFT"}
+        assert len(result.ohlcv) == 2 * len(mock_ohlcv_data)
+        assert isinstance(result.ohlcv["ticker"].dtype, pd.CategoricalDtype)
+        assert list(result.ohlcv["ticker"].cat.categories) == ["AAPL", "MSFT"]
+
+    def test_extract_ohlcv_skips_empty_ticker(self, mock_ohlcv_data: pd.DataFrame):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL", "INVALID"],
+            data_types=DataTypesConfig(
+                ohlcv=OHLCVConfig(
+                    start_date=date(2024, 1, 1),
+                    end_date=date(2024, 12, 1),
+                )
+            ),
         )
+        extractor = YFinanceExtractor(config)
 
-        with patch("finetl.extraction.yfinance.yf.download") as mock_download:
-            mock_download.return_value = multi_data
+        def history_for(symbol):
+            ticker = MagicMock()
+            ticker.history.return_value = (
+                mock_ohlcv_data if symbol == "AAPL" else pd.DataFrame()
+            )
+            return ticker
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.side_effect = history_for
 
             result = extractor.extract()
 
         assert result.ohlcv is not None
-        assert set(result.ohlcv["ticker"].unique()) == {"AAPL", "MSFT"}
+        assert set(result.ohlcv["ticker"].unique()) == {"AAPL"}
+        assert len(result.ohlcv) == len(mock_ohlcv_data)
+
+    def test_extract_ohlcv_intraday_datetime_index(self, mock_ohlcv_data: pd.DataFrame):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL"],
+            data_types=DataTypesConfig(
+                ohlcv=OHLCVConfig(
+                    start_date=date(2024, 1, 1),
+                    end_date=date(2024, 1, 5),
+                    interval=Interval.ONE_HOUR,
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        intraday = mock_ohlcv_data.copy()
+        intraday.index = pd.date_range(
+            "2024-01-02 14:30", periods=3, freq="h", tz="America/New_York"
+        ).rename("Datetime")
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value.history.return_value = intraday
+
+            result = extractor.extract()
+
+        df = result.ohlcv
+        assert df is not None
+        assert list(df.columns) == [
+            "ticker",
+            "date",
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+        ]
+        assert str(df["date"].dt.tz) == "UTC"
+
+    def test_extract_ohlcv_download_failure(self):
+        """Extraction fails only when every ticker's download fails."""
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL", "MSFT"],
+            data_types=DataTypesConfig(
+                ohlcv=OHLCVConfig(
+                    start_date=date(2024, 1, 1),
+                    end_date=date(2024, 12, 1),
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value.history.side_effect = Exception("timeout")
+
+            with pytest.raises(ExtractionError, match="for every ticker"):
+                extractor.extract()
+
+    def test_extract_ohlcv_skips_failed_ticker(self, mock_ohlcv_data: pd.DataFrame):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL", "BROKEN"],
+            data_types=DataTypesConfig(
+                ohlcv=OHLCVConfig(
+                    start_date=date(2024, 1, 1),
+                    end_date=date(2024, 12, 1),
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        def ticker_for(symbol):
+            ticker = MagicMock()
+            if symbol == "BROKEN":
+                ticker.history.side_effect = Exception("timeout")
+            else:
+                ticker.history.return_value = mock_ohlcv_data.copy()
+            return ticker
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.side_effect = ticker_for
+
+            result = extractor.extract()
+
+        assert result.ohlcv is not None
+        assert list(result.ohlcv["ticker"].unique()) == ["AAPL"]
+        assert len(result.ohlcv) == len(mock_ohlcv_data)
 
     def test_extract_financials(
         self,
@@ -154,7 +273,7 @@ class TestYFinanceExtractor:
         mock_ticker.quarterly_financials = mock_income_statement
         mock_ticker.quarterly_cashflow = mock_cashflow
 
-        with patch("finetl.extraction.yfinance.yf.Ticker") as mock_yf_ticker:
+        with patch("yfinance.Ticker") as mock_yf_ticker:
             mock_yf_ticker.return_value = mock_ticker
 
             result = extractor.extract()
@@ -165,6 +284,160 @@ class TestYFinanceExtractor:
         assert "Total Assets" in result.financials.columns
         assert result.financials["ticker"].iloc[0] == "AAPL"
 
+    def test_extract_financials_metrics_filter(
+        self,
+        mock_balance_sheet: pd.DataFrame,
+        mock_income_statement: pd.DataFrame,
+        mock_cashflow: pd.DataFrame,
+    ):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL"],
+            data_types=DataTypesConfig(
+                financials=FinancialsConfig(
+                    frequency=Frequency.QUARTERLY,
+                    metrics=["Total Assets", "Total Revenue", "Not A Metric"],
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        mock_ticker = MagicMock()
+        mock_ticker.quarterly_balance_sheet = mock_balance_sheet
+        mock_ticker.quarterly_financials = mock_income_statement
+        mock_ticker.quarterly_cashflow = mock_cashflow
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value = mock_ticker
+
+            result = extractor.extract()
+
+        assert result.financials is not None
+        assert list(result.financials.columns) == [
+            "ticker",
+            "period",
+            "Total Assets",
+            "Total Revenue",
+        ]
+
+    def test_extract_financials_aligns_statements_on_period(
+        self,
+        mock_balance_sheet: pd.DataFrame,
+    ):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL"],
+            data_types=DataTypesConfig(
+                financials=FinancialsConfig(
+                    frequency=Frequency.QUARTERLY,
+                    statements=[
+                        StatementType.BALANCE_SHEET,
+                        StatementType.CASH_FLOW,
+                    ],
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        # Cash flow covers an extra period and repeats a balance sheet metric
+        periods = pd.to_datetime(["2024-09-30", "2024-03-31"])
+        cashflow = pd.DataFrame(
+            {periods[0]: [1.0, 352583000000], periods[1]: [2.0, 340000000000]},
+            index=["Operating Cash Flow", "Total Assets"],
+        )
+
+        mock_ticker = MagicMock()
+        mock_ticker.quarterly_balance_sheet = mock_balance_sheet
+        mock_ticker.quarterly_cashflow = cashflow
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value = mock_ticker
+
+            result = extractor.extract()
+
+        df = result.financials
+        assert df is not None
+        assert list(df["period"]) == list(
+            pd.to_datetime(["2024-03-31", "2024-06-30", "2024-09-30"])
+        )
+        assert list(df.columns).count("Total Assets") == 1
+        assert df["Operating Cash Flow"].isna().sum() == 1
+        # Periods only the cash flow reports keep its value for the metric
+        assert list(df["Total Assets"]) == [340000000000, 348000000000, 352583000000]
+
+    def test_extract_financials_repeated_period(
+        self,
+        mock_balance_sheet: pd.DataFrame,
+    ):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL"],
+            data_types=DataTypesConfig(
+                financials=FinancialsConfig(
+                    frequency=Frequency.QUARTERLY,
+                    statements=[
+                        StatementType.BALANCE_SHEET,
+                        StatementType.CASH_FLOW,
+                    ],
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        cashflow = pd.DataFrame(
+            [[1.0, 2.0, 3.0]],
+            index=["Operating Cash Flow"],
+            columns=pd.to_datetime(["2024-09-30", "2024-09-30", "2024-06-30"]),
+        )
+
+        mock_ticker = MagicMock()
+        mock_ticker.quarterly_balance_sheet = mock_balance_sheet
+        mock_ticker.quarterly_cashflow = cashflow
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value = mock_ticker
+
+            result = extractor.extract()
+
+        df = result.financials
+        assert df is not None
+        assert list(df["period"]) == list(pd.to_datetime(["2024-06-30", "2024-09-30"]))
+        assert list(df["Operating Cash Flow"]) == [3.0, 1.0]
+        assert list(df["Total Assets"]) == [348000000000, 352583000000]
+
+    def test_extract_financials_skips_failed_ticker(
+        self,
+        mock_balance_sheet: pd.DataFrame,
+    ):
+        config = ExtractionConfig(
+            source="yfinance",
+            tickers=["AAPL", "BROKEN", "MSFT"],
+            data_types=DataTypesConfig(
+                financials=FinancialsConfig(
+                    frequency=Frequency.QUARTERLY,
+                    statements=[StatementType.BALANCE_SHEET],
+                )
+            ),
+        )
+        extractor = YFinanceExtractor(config)
+
+        def ticker_for(symbol):
+            if symbol == "BROKEN":
+                raise Exception("Not found")
+            ticker = MagicMock()
+            ticker.quarterly_balance_sheet = mock_balance_sheet
+            return ticker
+
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.side_effect = ticker_for
+
+            result = extractor.extract()
+
+        assert result.financials is not None
+        assert list(result.financials.columns[:2]) == ["ticker", "period"]
+        assert list(result.financials["ticker"].unique()) == ["AAPL", "MSFT"]
+        assert len(result.financials) == 2 * len(mock_balance_sheet.columns)
+
     def test_extract_empty_ohlcv(self):
         config = ExtractionConfig(
             source="yfinance",
@@ -178,8 +451,8 @@ class TestYFinanceExtractor:
         )
         extractor = YFinanceExtractor(config)
 
-        with patch("finetl.extraction.yfinance.yf.download") as mock_download:
-            mock_download.return_value = pd.DataFrame()
+        with patch("yfinance.Ticker") as mock_yf_ticker:
+            mock_yf_ticker.return_value.history.return_value = pd.DataFrame()
 
             result = extractor.extract()
 
@@ -212,12 +485,9 @@ class TestYFinanceExtractor:
         mock_ticker.quarterly_balance_sheet = mock_balance_sheet
         mock_ticker.quarterly_financials = mock_income_statement
         mock_ticker.quarterly_cashflow = mock_cashflow
+        mock_ticker.history.return_value = mock_ohlcv_data
 
-        with (
-            patch("finetl.extraction.yfinance.yf.download") as mock_download,
-            patch("finetl.extraction.yfinance.yf.Ticker") as mock_yf_ticker,
-        ):
-            mock_download.return_value = mock_ohlcv_data
+        with patch("yfinance.Ticker") as mock_yf_ticker:
             mock_yf_ticker.return_value = mock_ticker
 
             result = extractor.extract()
@@ -226,3 +496,4 @@ class TestYFinanceExtractor:
         assert result.financials is not None
         assert not result.ohlcv.empty
         assert not result.financials.empty
+        mock_yf_ticker.assert_called_once_with("AAPL")
@@ -72,18 +72,9 @@ class TestFinETL:
         mock_ticker.quarterly_balance_sheet = mock_balance_sheet
         mock_ticker.quarterly_financials = mock_balance_sheet
         mock_ticker.quarterly_cashflow = mock_balance_sheet
+        mock_ticker.history.return_value = mock_ohlcv
 
-        # Create multi-ticker response format
-        multi_data = pd.concat(
-            {"AAPL": mock_ohlcv, "MSFT": mock_ohlcv},
-            axis=1,
-        )
-
-        with (
-            patch("finetl.extraction.yfinance.yf.download") as mock_download,
-            patch("finetl.extraction.yfinance.yf.Ticker") as mock_yf_ticker,
-        ):
-            mock_download.return_value = multi_data
+        with patch("yfinance.Ticker") as mock_yf_ticker:
             mock_yf_ticker.return_value = mock_ticker
 
             etl.run()
@@ -1,15 +1,21 @@
 """Tests for data loading."""
 
+import subprocess
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import pytest
 
 from finetl.base import BaseLoader
 from finetl.config.schema import LoadingConfig
 from finetl.exceptions import ConfigurationError, LoadingError
 from finetl.loading import (
+    ArrowIPCLoader,
     CSVLoader,
     HuggingFaceLoader,
     ParquetLoader,
@@ -17,6 +23,10 @@ from finetl.loading import (
     get_loader,
     register_loader,
 )
+from finetl.loading.postgresql import (
+    _binary_copy_insert,
+    _copy_insert,
+)
 from finetl.models import ExtractedData
 
 
@@ -25,16 +35,16 @@ class TestCSVLoader:
 
     def test_load_ohlcv_only(
         self,
-        tmp_path: Path,
+        output_dir: Path,
         sample_ohlcv_df: pd.DataFrame,
     ):
-        config = LoadingConfig(destination="csv", path=str(tmp_path / "output"))
+        config = LoadingConfig(destination="csv", path=str(output_dir))
         loader = CSVLoader(config)
 
         data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
         loader.load(data)
 
-        ohlcv_path = tmp_path / "output" / "ohlcv.csv"
+        ohlcv_path = output_dir / "ohlcv.csv"
         assert ohlcv_path.exists()
 
         loaded = pd.read_csv(ohlcv_path)
@@ -43,33 +53,176 @@ class TestCSVLoader:
 
     def test_load_financials_only(
         self,
-        tmp_path: Path,
+        output_dir: Path,
         sample_financials_df: pd.DataFrame,
     ):
-        config = LoadingConfig(destination="csv", path=str(tmp_path / "output"))
+        config = LoadingConfig(destination="csv", path=str(output_dir))
         loader = CSVLoader(config)
 
         data = ExtractedData(ohlcv=None, financials=sample_financials_df)
         loader.load(data)
 
-        financials_path = tmp_path / "output" / "financials.csv"
+        financials_path = output_dir / "financials.csv"
         assert financials_path.exists()
 
         loaded = pd.read_csv(financials_path)
         assert len(loaded) == len(sample_financials_df)
 
-    def test_load_both(
+    def test_creates_directory_once(
         self,
         tmp_path: Path,
-        sample_extracted_data: ExtractedData,
+        sample_ohlcv_df: pd.DataFrame,
     ):
         config = LoadingConfig(destination="csv", path=str(tmp_path / "output"))
         loader = CSVLoader(config)
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        loader.load(data)
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            loader.load(data)
+
+        mock_mkdir.assert_not_called()
+        assert (tmp_path / "output" / "ohlcv.csv").exists()
+
+    def test_csv_data_integrity(
+        self,
+        output_dir: Path,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        """Verify data matches after round-trip through CSV."""
+        config = LoadingConfig(destination="csv", path=str(output_dir))
+        loader = CSVLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        loader.load(data)
+
+        loaded = pd.read_csv(
+            output_dir / "ohlcv.csv",
+            parse_dates=["date"],
+            dtype={"ticker": "category"},
+        )
+        pd.testing.assert_frame_equal(loaded, sample_ohlcv_df, check_dtype=False)
+
+    def test_csv_text_format(
+        self,
+        output_dir: Path,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        """Check the raw text, which a read_csv round-trip can't see."""
+        df = sample_ohlcv_df.astype({"close": "float64"})
+        df.loc[0, "close"] = 186.0
+        config = LoadingConfig(destination="csv", path=str(output_dir))
+        loader = CSVLoader(config)
+
+        loader.load(ExtractedData(ohlcv=df, financials=None))
+
+        text = (output_dir / "ohlcv.csv").read_text()
+        assert text.splitlines()[:2] == [
+            "ticker,date,open,high,low,close,volume",
+            "AAPL,2024-01-02,185.5,186.2,184.8,186,45000000",
+        ]
+
+    def test_csv_float_format(self, output_dir: Path):
+        """Floats are written in Arrow's shortest round-trip form."""
+        df = pd.DataFrame(
+            {"ticker": ["A", "B", "C", "D"], "value": [186.0, 3.5e11, 0.0001, None]}
+        )
+        config = LoadingConfig(destination="csv", path=str(output_dir))
+        loader = CSVLoader(config)
+
+        loader.load(ExtractedData(ohlcv=None, financials=df))
+
+        text = (output_dir / "financials.csv").read_text()
+        assert text == "ticker,value\nA,186\nB,3.5e+11\nC,0.0001\nD,\n"
+        loaded = pd.read_csv(output_dir / "financials.csv")
+        pd.testing.assert_frame_equal(loaded, df)
+
+    @pytest.mark.parametrize(
+        "df",
+        [
+            pd.DataFrame(
+                {
+                    "ticker": ["AAPL", "BRK,B"],
+                    "note": ['say "hi"', None],
+                    "value": [1e16, float("nan")],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "period": pd.to_datetime(
+                        ["2024-01-02 09:30:00.5", None], format="ISO8601"
+                    ),
+                    "flag": [True, False],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "ticker": ["AAPL", "AAPL", "MSFT"],
+                    "date": pd.to_datetime(
+                        [
+                            "2024-01-02 14:30:00",
+                            "2024-01-02 14:30:00.25",
+                            None,
+                        ],
+                        format="ISO8601",
+                        utc=True,
+                    ),
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "date": pd.to_datetime(
+                        ["2024-01-02 09:30:00", "2024-07-02 09:30:00"]
+                    ).tz_localize("America/New_York"),
+                }
+            ),
+        ],
+    )
+    def test_csv_text_matches_pandas(self, output_dir: Path, df: pd.DataFrame):
+        config = LoadingConfig(destination="csv", path=str(output_dir))
+        loader = CSVLoader(config)
+
+        loader.load(ExtractedData(ohlcv=None, financials=df))
+
+        text = (output_dir / "financials.csv").read_text()
+        assert text == df.to_csv(index=False)
+
+    @pytest.mark.parametrize("batch_size", [1, 1024, 131072])
+    def test_custom_batch_size(
+        self,
+        output_dir: Path,
+        sample_ohlcv_df: pd.DataFrame,
+        batch_size: int,
+    ):
+        config = LoadingConfig(
+            destination="csv",
+            path=str(output_dir),
+            csv_batch_size=batch_size,
+        )
+        loader = CSVLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        loader.load(data)
+
+        loaded = pd.read_csv(
+            output_dir / "ohlcv.csv",
+            parse_dates=["date"],
+            dtype={"ticker": "category"},
+        )
+        pd.testing.assert_frame_equal(loaded, sample_ohlcv_df, check_dtype=False)
+
+    def test_load_both(
+        self,
+        output_dir: Path,
+        sample_extracted_data: ExtractedData,
+    ):
+        config = LoadingConfig(destination="csv", path=str(output_dir))
+        loader = CSVLoader(config)
 
         loader.load(sample_extracted_data)
 
-        ohlcv_path = tmp_path / "output" / "ohlcv.csv"
-        financials_path = tmp_path / "output" / "financials.csv"
+        ohlcv_path = output_dir / "ohlcv.csv"
+        financials_path = output_dir / "financials.csv"
         assert ohlcv_path.exists()
         assert financials_path.exists()
 
@@ -105,16 +258,16 @@ class TestParquetLoader:
 
     def test_load_ohlcv_only(
         self,
-        tmp_path: Path,
+        output_dir: Path,
         sample_ohlcv_df: pd.DataFrame,
     ):
-        config = LoadingConfig(destination="parquet", path=str(tmp_path / "output"))
+        config = LoadingConfig(destination="parquet", path=str(output_dir))
         loader = ParquetLoader(config)
 
         data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
         loader.load(data)
 
-        ohlcv_path = tmp_path / "output" / "ohlcv.parquet"
+        ohlcv_path = output_dir / "ohlcv.parquet"
         assert ohlcv_path.exists()
 
         loaded = pd.read_parquet(ohlcv_path)
@@ -123,16 +276,16 @@ class TestParquetLoader:
 
     def test_load_financials_only(
         self,
-        tmp_path: Path,
+        output_dir: Path,
         sample_financials_df: pd.DataFrame,
     ):
-        config = LoadingConfig(destination="parquet", path=str(tmp_path / "output"))
+        config = LoadingConfig(destination="parquet", path=str(output_dir))
         loader = ParquetLoader(config)
 
         data = ExtractedData(ohlcv=None, financials=sample_financials_df)
         loader.load(data)
 
-        financials_path = tmp_path / "output" / "financials.parquet"
+        financials_path = output_dir / "financials.parquet"
         assert financials_path.exists()
 
         loaded = pd.read_parquet(financials_path)
@@ -140,16 +293,16 @@ class TestParquetLoader:
 
     def test_load_both(
         self,
-        tmp_path: Path,
+        output_dir: Path,
         sample_extracted_data: ExtractedData,
     ):
-        config = LoadingConfig(destination="parquet", path=str(tmp_path / "output"))
+        config = LoadingConfig(destination="parquet", path=str(output_dir))
         loader = ParquetLoader(config)
 
         loader.load(sample_extracted_data)
 
-        ohlcv_path = tmp_path / "output" / "ohlcv.parquet"
-        financials_path = tmp_path / "output" / "financials.parquet"
+        ohlcv_path = output_dir / "ohlcv.parquet"
+        financials_path = output_dir / "financials.parquet"
         assert ohlcv_path.exists()
         assert financials_path.exists()
 
@@ -181,17 +334,128 @@ class TestParquetLoader:
 
     def test_parquet_data_integrity(
         self,
-        tmp_path: Path,
+        output_dir: Path,
         sample_ohlcv_df: pd.DataFrame,
     ):
         """Verify data matches after round-trip through Parquet."""
-        config = LoadingConfig(destination="parquet", path=str(tmp_path / "output"))
+        config = LoadingConfig(destination="parquet", path=str(output_dir))
+        loader = ParquetLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        loader.load(data)
+
+        # Read back the way downstream consumers should: memory-mapped, with
+        # columns handed to pandas without consolidating them into blocks
+        table = pq.read_table(output_dir / "ohlcv.parquet", memory_map=True)
+        loaded = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        pd.testing.assert_frame_equal(loaded, sample_ohlcv_df)
+
+    def test_parquet_uses_zstd(
+        self,
+        output_dir: Path,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = LoadingConfig(destination="parquet", path=str(output_dir))
+        loader = ParquetLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        loader.load(data)
+
+        metadata = pq.read_metadata(output_dir / "ohlcv.parquet")
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_parquet_row_groups(
+        self,
+        output_dir: Path,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = LoadingConfig(
+            destination="parquet",
+            path=str(output_dir),
+            row_group_size=3,
+        )
         loader = ParquetLoader(config)
 
         data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
         loader.load(data)
 
-        loaded = pd.read_parquet(tmp_path / "output" / "ohlcv.parquet")
+        path = output_dir / "ohlcv.parquet"
+        assert pq.read_metadata(path).num_row_groups == 2
+        pd.testing.assert_frame_equal(pd.read_parquet(path), sample_ohlcv_df)
+
+    def test_parquet_row_groups_above_pyarrow_default(self, output_dir: Path):
+        """Row groups may exceed pyarrow's default limit of 1Mi rows."""
+        df = pd.DataFrame({"value": range(1_500_000)})
+        config = LoadingConfig(
+            destination="parquet",
+            path=str(output_dir),
+            row_group_size=1_200_000,
+        )
+        loader = ParquetLoader(config)
+
+        loader.load(ExtractedData(ohlcv=df, financials=None))
+
+        metadata = pq.read_metadata(output_dir / "ohlcv.parquet")
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        assert sizes == [1_200_000, 300_000]
+
+    def test_parquet_compression_option(
+        self,
+        output_dir: Path,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = LoadingConfig(
+            destination="parquet",
+            path=str(output_dir),
+            compression="snappy",
+        )
+        loader = ParquetLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        loader.load(data)
+
+        metadata = pq.read_metadata(output_dir / "ohlcv.parquet")
+        assert metadata.row_group(0).column(0).compression == "SNAPPY"
+
+
+class TestArrowIPCLoader:
+    """Tests for ArrowIPCLoader."""
+
+    def test_load_both(
+        self,
+        tmp_path: Path,
+        sample_extracted_data: ExtractedData,
+    ):
+        config = LoadingConfig(destination="arrow", path=str(tmp_path / "output"))
+        loader = ArrowIPCLoader(config)
+
+        loader.load(sample_extracted_data)
+
+        assert (tmp_path / "output" / "ohlcv.arrow").exists()
+        assert (tmp_path / "output" / "financials.arrow").exists()
+
+    def test_load_empty_data(self, tmp_path: Path):
+        config = LoadingConfig(destination="arrow", path=str(tmp_path / "output"))
+        loader = ArrowIPCLoader(config)
+
+        loader.load(ExtractedData(ohlcv=None, financials=None))
+
+        assert not (tmp_path / "output").exists()
+
+    def test_arrow_data_integrity(
+        self,
+        tmp_path: Path,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        """Verify data matches after round-trip through Arrow IPC."""
+        config = LoadingConfig(destination="arrow", path=str(tmp_path / "output"))
+        loader = ArrowIPCLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        loader.load(data)
+
+        loaded = feather.read_feather(tmp_path / "output" / "ohlcv.arrow")
         pd.testing.assert_frame_equal(loaded, sample_ohlcv_df)
 
 
@@ -210,11 +474,12 @@ class TestHuggingFaceLoader:
 
         data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
 
-        with patch("finetl.loading.huggingface.DatasetDict") as mock_dataset_dict:
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
             mock_instance = MagicMock()
             mock_dataset_dict.return_value = mock_instance
 
             loader.load(data)
+            loader.wait()
 
             # Verify DatasetDict was created with ohlcv key
             call_args = mock_dataset_dict.call_args[0][0]
@@ -223,9 +488,35 @@ class TestHuggingFaceLoader:
 
             # Verify push_to_hub was called correctly
             mock_instance.push_to_hub.assert_called_once_with(
-                "test-user/test-repo", private=False
+                "test-user/test-repo", private=False, num_proc=None
             )
 
+    def test_datasets_wrap_arrow_tables(
+        self,
+        sample_extracted_data: ExtractedData,
+    ):
+        from datasets import Dataset
+
+        config = LoadingConfig(
+            destination="huggingface",
+            repo_id="test-user/test-repo",
+        )
+        loader = HuggingFaceLoader(config)
+
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
+            loader.load(sample_extracted_data)
+            loader.wait()
+
+        datasets = mock_dataset_dict.call_args[0][0]
+        for name, df in (
+            ("ohlcv", sample_extracted_data.ohlcv),
+            ("financials", sample_extracted_data.financials),
+        ):
+            dataset = datasets[name]
+            assert isinstance(dataset, Dataset)
+            assert dataset.data.table.column_names == list(df.columns)
+            assert dataset.num_rows == len(df)
+
     def test_load_financials_only(
         self,
         sample_financials_df: pd.DataFrame,
@@ -238,11 +529,12 @@ class TestHuggingFaceLoader:
 
         data = ExtractedData(ohlcv=None, financials=sample_financials_df)
 
-        with patch("finetl.loading.huggingface.DatasetDict") as mock_dataset_dict:
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
             mock_instance = MagicMock()
             mock_dataset_dict.return_value = mock_instance
 
             loader.load(data)
+            loader.wait()
 
             # Verify DatasetDict was created with financials key
             call_args = mock_dataset_dict.call_args[0][0]
@@ -261,11 +553,12 @@ class TestHuggingFaceLoader:
         )
         loader = HuggingFaceLoader(config)
 
-        with patch("finetl.loading.huggingface.DatasetDict") as mock_dataset_dict:
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
             mock_instance = MagicMock()
             mock_dataset_dict.return_value = mock_instance
 
             loader.load(sample_extracted_data)
+            loader.wait()
 
             # Verify DatasetDict was created with both keys
             call_args = mock_dataset_dict.call_args[0][0]
@@ -283,8 +576,9 @@ class TestHuggingFaceLoader:
 
         data = ExtractedData(ohlcv=None, financials=None)
 
-        with patch("finetl.loading.huggingface.DatasetDict") as mock_dataset_dict:
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
             loader.load(data)
+            loader.wait()
 
             # push_to_hub should not be called for empty data
             mock_dataset_dict.return_value.push_to_hub.assert_not_called()
@@ -302,17 +596,68 @@ class TestHuggingFaceLoader:
 
         data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
 
-        with patch("finetl.loading.huggingface.DatasetDict") as mock_dataset_dict:
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
             mock_instance = MagicMock()
             mock_dataset_dict.return_value = mock_instance
 
             loader.load(data)
+            loader.wait()
 
             # Verify private flag is passed
             mock_instance.push_to_hub.assert_called_once_with(
-                "test-user/private-repo", private=True
+                "test-user/private-repo", private=True, num_proc=None
             )
 
+    def test_fast_upload(
+        self,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = LoadingConfig(
+            destination="huggingface",
+            repo_id="test-user/test-repo",
+            num_proc=4,
+        )
+        loader = HuggingFaceLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        with (
+            patch("datasets.DatasetDict") as mock_dataset_dict,
+            patch("finetl.loading.huggingface._enable_fast_upload") as mock_enable,
+        ):
+            mock_instance = MagicMock()
+            mock_dataset_dict.return_value = mock_instance
+
+            loader.load(data)
+            loader.wait()
+
+            mock_enable.assert_called_once()
+            mock_instance.push_to_hub.assert_called_once_with(
+                "test-user/test-repo", private=False, num_proc=4
+            )
+
+    def test_fast_upload_disabled(
+        self,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = LoadingConfig(
+            destination="huggingface",
+            repo_id="test-user/test-repo",
+            fast_upload=False,
+        )
+        loader = HuggingFaceLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        with (
+            patch("datasets.DatasetDict"),
+            patch("finetl.loading.huggingface._enable_fast_upload") as mock_enable,
+        ):
+            loader.load(data)
+            loader.wait()
+
+            mock_enable.assert_not_called()
+
     def test_push_to_hub_failure(
         self,
         sample_ohlcv_df: pd.DataFrame,
@@ -325,13 +670,42 @@ class TestHuggingFaceLoader:
 
         data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
 
-        with patch("finetl.loading.huggingface.DatasetDict") as mock_dataset_dict:
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
             mock_instance = MagicMock()
             mock_instance.push_to_hub.side_effect = Exception("Upload failed")
             mock_dataset_dict.return_value = mock_instance
 
+            loader.load(data)
             with pytest.raises(LoadingError, match="Failed to upload to HuggingFace"):
-                loader.load(data)
+                loader.wait()
+
+    def test_load_does_not_block_on_upload(
+        self,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = LoadingConfig(
+            destination="huggingface",
+            repo_id="test-user/test-repo",
+        )
+        loader = HuggingFaceLoader(config)
+
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        upload_released = threading.Event()
+
+        with patch("datasets.DatasetDict") as mock_dataset_dict:
+            mock_instance = MagicMock()
+            mock_instance.push_to_hub.side_effect = lambda *a, **kw: (
+                upload_released.wait(timeout=5)
+            )
+            mock_dataset_dict.return_value = mock_instance
+
+            loader.load(data)
+            assert loader._upload_future is not None
+            assert not loader._upload_future.done()
+
+            upload_released.set()
+            loader.wait()
+            mock_instance.push_to_hub.assert_called_once()
 
     def test_config_requires_repo_id(self):
         with pytest.raises(ValueError, match="repo_id is required"):
@@ -341,6 +715,13 @@ class TestHuggingFaceLoader:
 class TestPostgreSQLLoader:
     """Tests for PostgreSQLLoader."""
 
+    @pytest.fixture(autouse=True)
+    def clear_engines(self):
+        """Keep shared engines from leaking between tests."""
+        PostgreSQLLoader._engines.clear()
+        yield
+        PostgreSQLLoader._engines.clear()
+
     @pytest.fixture
     def pg_config(self) -> LoadingConfig:
         """Sample PostgreSQL configuration."""
@@ -375,8 +756,9 @@ class TestPostgreSQLLoader:
                     schema="public",
                     if_exists="append",
                     index=False,
+                    method=_copy_insert,
                 )
-                mock_engine.dispose.assert_called_once()
+                mock_engine.dispose.assert_not_called()
 
     def test_load_financials_only(
         self,
@@ -399,6 +781,7 @@ class TestPostgreSQLLoader:
                     schema="public",
                     if_exists="append",
                     index=False,
+                    method=_copy_insert,
                 )
 
     def test_load_both(
@@ -423,6 +806,301 @@ class TestPostgreSQLLoader:
                 mock_ohlcv_sql.assert_called_once()
                 mock_fin_sql.assert_called_once()
 
+    def test_copy_insert(self):
+        table = MagicMock()
+        table.name = "financials"
+        table.schema = "public"
+        table.frame = pd.DataFrame(
+            {
+                "ticker": ["AAPL", "MSFT"],
+                "Total Assets": [1.5, None],
+                "x": [None, "a,b"],
+            }
+        )
+        conn = MagicMock()
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+        cursor.rowcount = 2
+
+        keys = ["ticker", "Total Assets", "x"]
+        result = _copy_insert(table, conn, keys, iter([]))
+
+        assert result == 2
+        sql = cursor.copy_expert.call_args.args[0]
+        assert sql == (
+            'COPY "public"."financials" ("ticker", "Total Assets", "x") '
+            "FROM STDIN WITH (FORMAT CSV)"
+        )
+        assert copied == [b'"AAPL",1.5,\n"MSFT",,"a,b"\n']
+
+    def test_copy_insert_streams_batches(self):
+        table = MagicMock()
+        table.name = "ohlcv"
+        table.schema = None
+        table.frame = pd.DataFrame({"ticker": ["AAPL", "MSFT", "GOOG"]})
+        conn = MagicMock()
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+        chunks = []
+
+        def consume(sql, buf):
+            while data := buf.read(4):
+                chunks.append(data)
+
+        cursor.copy_expert.side_effect = consume
+
+        with patch("finetl.loading.postgresql._COPY_BATCH_ROWS", 2):
+            _copy_insert(table, conn, ["ticker"], iter([]))
+
+        assert cursor.copy_expert.call_args.args[0].startswith('COPY "ohlcv" (')
+        assert b"".join(chunks) == b'"AAPL"\n"MSFT"\n"GOOG"\n'
+
+    def test_binary_copy_insert(self):
+        table = MagicMock()
+        table.name = "financials"
+        table.schema = "public"
+        conn = MagicMock()
+        pgcopy = MagicMock()
+        rows = [("AAPL", 1.5)]
+
+        with patch.dict(sys.modules, {"pgcopy": pgcopy}):
+            _binary_copy_insert(table, conn, ["ticker", "Total Assets"], rows)
+
+        pgcopy.CopyManager.assert_called_once_with(
+            conn.connection.dbapi_connection,
+            "public.financials",
+            ["ticker", "Total Assets"],
+        )
+        pgcopy.CopyManager.return_value.threading_copy.assert_called_once_with(rows)
+
+    @pytest.mark.parametrize(
+        ("table_exists", "creates_table"), [(False, True), (True, False)]
+    )
+    def test_load_upsert(
+        self,
+        pg_config: LoadingConfig,
+        sample_ohlcv_df: pd.DataFrame,
+        table_exists: bool,
+        creates_table: bool,
+    ):
+        loader = PostgreSQLLoader(pg_config.model_copy(update={"upsert": True}))
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        with (
+            patch.object(loader, "_create_engine") as mock_create_engine,
+            patch("sqlalchemy.inspect") as mock_inspect,
+            patch.object(pd.DataFrame, "to_sql") as mock_to_sql,
+        ):
+            mock_inspect.return_value.has_table.return_value = table_exists
+            loader.load(data)
+
+            conn = mock_create_engine.return_value.begin.return_value.__enter__()
+            assert mock_to_sql.call_count == (2 if creates_table else 1)
+            mock_to_sql.assert_called_with(
+                name="_finetl_staging_ohlcv",
+                con=conn,
+                if_exists="append",
+                index=False,
+                method=_copy_insert,
+            )
+
+            columns = '"ticker", "date", "open", "high", "low", "close", "volume"'
+            statements = [c.args[0] for c in conn.exec_driver_sql.call_args_list]
+            expected = [
+                'CREATE TEMPORARY TABLE "_finetl_staging_ohlcv" '
+                '(LIKE "public"."ohlcv") ON COMMIT DROP',
+                f'INSERT INTO "public"."ohlcv" ({columns}) '
+                f'SELECT {columns} FROM "_finetl_staging_ohlcv" '
+                'ON CONFLICT ("ticker", "date") DO NOTHING',
+            ]
+            if creates_table:
+                expected.insert(
+                    0,
+                    'ALTER TABLE "public"."ohlcv" ADD PRIMARY KEY ("ticker", "date")',
+                )
+            assert statements == expected
+
+    def test_load_upsert_without_copy(
+        self,
+        pg_config: LoadingConfig,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        config = pg_config.model_copy(update={"upsert": True, "use_copy": False})
+        loader = PostgreSQLLoader(config)
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        with (
+            patch.object(loader, "_create_engine"),
+            patch("sqlalchemy.inspect") as mock_inspect,
+            patch.object(pd.DataFrame, "to_sql") as mock_to_sql,
+        ):
+            mock_inspect.return_value.has_table.return_value = True
+            loader.load(data)
+
+            # The staging table is filled with multi-row INSERTs, not COPY
+            kwargs = mock_to_sql.call_args.kwargs
+            assert kwargs["name"] == "_finetl_staging_ohlcv"
+            assert kwargs["method"] == "multi"
+            # Capped by the bind parameter limit for the 7 columns
+            assert kwargs["chunksize"] == 30000 // 7
+
+    def test_binary_copy_insert_falls_back_to_csv(self):
+        table = MagicMock()
+        table.name = "financials"
+        table.schema = "public"
+        conn = MagicMock()
+        table.frame = pd.DataFrame({"ticker": ["AAPL"]})
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+        pgcopy = MagicMock()
+        pgcopy.CopyManager.side_effect = TypeError("type money is not supported")
+
+        with patch.dict(sys.modules, {"pgcopy": pgcopy}):
+            _binary_copy_insert(table, conn, ["ticker"], [("AAPL",)])
+
+        cursor.copy_expert.assert_called_once()
+        assert "FORMAT CSV" in cursor.copy_expert.call_args.args[0]
+
+    def test_insert_method_selection(
+        self, pg_config: LoadingConfig, sample_ohlcv_df: pd.DataFrame
+    ):
+        loader = PostgreSQLLoader(pg_config.model_copy(update={"binary_copy": True}))
+        with patch("importlib.util.find_spec", return_value=MagicMock()):
+            options = loader._insert_options(sample_ohlcv_df)
+            assert options == {"method": _binary_copy_insert}
+        with patch("importlib.util.find_spec", return_value=None):
+            assert loader._insert_options(sample_ohlcv_df) == {"method": _copy_insert}
+
+        disabled = PostgreSQLLoader(pg_config)
+        with patch("importlib.util.find_spec", return_value=MagicMock()):
+            options = disabled._insert_options(sample_ohlcv_df)
+            assert options == {"method": _copy_insert}
+
+    def test_multi_insert_without_copy(
+        self, pg_config: LoadingConfig, sample_ohlcv_df: pd.DataFrame
+    ):
+        loader = PostgreSQLLoader(pg_config.model_copy(update={"use_copy": False}))
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        with (
+            patch.object(loader, "_create_engine"),
+            patch.object(sample_ohlcv_df, "to_sql") as mock_to_sql,
+        ):
+            loader.load(data)
+
+        kwargs = mock_to_sql.call_args.kwargs
+        assert kwargs["method"] == "multi"
+        # 7 columns, so each statement binds at most 30000 parameters
+        assert kwargs["chunksize"] == 30000 // 7
+
+    def test_multi_insert_chunksize_option(
+        self, pg_config: LoadingConfig, sample_ohlcv_df: pd.DataFrame
+    ):
+        config = pg_config.model_copy(update={"use_copy": False, "chunksize": 500})
+        loader = PostgreSQLLoader(config)
+
+        options = loader._insert_options(sample_ohlcv_df)
+
+        assert options == {"method": "multi", "chunksize": 500}
+
+    def test_connection_url_escapes_password(self, pg_config: LoadingConfig):
+        config = pg_config.model_copy(update={"password": "p@ss:w/rd%"})
+        loader = PostgreSQLLoader(config)
+
+        engine = loader._create_engine()
+
+        assert engine.url.password == "p@ss:w/rd%"
+        assert engine.url.host == "localhost"
+        assert engine.url.drivername == "postgresql+psycopg2"
+        engine.dispose()
+
+    def test_engine_reused_until_close(
+        self,
+        pg_config: LoadingConfig,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        loader = PostgreSQLLoader(pg_config)
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+
+        with (
+            patch.object(loader, "_create_engine") as mock_create_engine,
+            patch.object(sample_ohlcv_df, "to_sql"),
+            patch("atexit.register") as mock_register,
+        ):
+            loader.load(data)
+            loader.load(data)
+            mock_create_engine.assert_called_once()
+
+            loader.close()
+            mock_create_engine.return_value.dispose.assert_called_once()
+
+            loader.load(data)
+            assert mock_create_engine.call_count == 2
+            # The exit hook is registered once, when the module is imported
+            mock_register.assert_not_called()
+
+    def test_engine_shared_between_loaders(
+        self,
+        pg_config: LoadingConfig,
+        sample_ohlcv_df: pd.DataFrame,
+    ):
+        data = ExtractedData(ohlcv=sample_ohlcv_df, financials=None)
+        first = PostgreSQLLoader(pg_config)
+        second = PostgreSQLLoader(pg_config)
+        other = PostgreSQLLoader(pg_config.model_copy(update={"database": "other"}))
+
+        with (
+            patch.object(
+                PostgreSQLLoader, "_create_engine", side_effect=lambda: MagicMock()
+            ) as mock_create_engine,
+            patch.object(sample_ohlcv_df, "to_sql"),
+        ):
+            first.load(data)
+            second.load(data)
+            mock_create_engine.assert_called_once()
+            assert first._get_engine() is second._get_engine()
+
+            other.load(data)
+            assert mock_create_engine.call_count == 2
+            assert other._get_engine() is not first._get_engine()
+
+    def test_load_writes_tables_concurrently(
+        self,
+        pg_config: LoadingConfig,
+        sample_extracted_data: ExtractedData,
+    ):
+        loader = PostgreSQLLoader(pg_config)
+        # Each write only finishes once the other one has started
+        barrier = threading.Barrier(2, timeout=5)
+
+        with (
+            patch.object(loader, "_create_engine"),
+            patch.object(sample_extracted_data.ohlcv, "to_sql") as mock_ohlcv_sql,
+            patch.object(sample_extracted_data.financials, "to_sql") as mock_fin_sql,
+        ):
+            mock_ohlcv_sql.side_effect = lambda **kwargs: barrier.wait()
+            mock_fin_sql.side_effect = lambda **kwargs: barrier.wait()
+            loader.load(sample_extracted_data)
+
+        mock_ohlcv_sql.assert_called_once()
+        mock_fin_sql.assert_called_once()
+
+    def test_financials_write_failure(
+        self,
+        pg_config: LoadingConfig,
+        sample_extracted_data: ExtractedData,
+    ):
+        loader = PostgreSQLLoader(pg_config)
+
+        with (
+            patch.object(loader, "_create_engine"),
+            patch.object(sample_extracted_data.ohlcv, "to_sql"),
+            patch.object(sample_extracted_data.financials, "to_sql") as mock_fin_sql,
+        ):
+            mock_fin_sql.side_effect = Exception("Connection failed")
+
+            with pytest.raises(LoadingError, match="Failed to write financials data"):
+                loader.load(sample_extracted_data)
+
     def test_load_empty_data(self, pg_config: LoadingConfig):
         loader = PostgreSQLLoader(pg_config)
         data = ExtractedData(ohlcv=None, financials=None)
@@ -459,6 +1137,7 @@ class TestPostgreSQLLoader:
                     schema="public",
                     if_exists="replace",
                     index=False,
+                    method=_copy_insert,
                 )
 
     def test_custom_schema(
@@ -489,6 +1168,7 @@ class TestPostgreSQLLoader:
                     schema="finance",
                     if_exists="append",
                     index=False,
+                    method=_copy_insert,
                 )
 
     def test_write_failure(
@@ -565,6 +1245,30 @@ class TestLoaderRegistry:
         loader_class = get_loader("postgresql")
         assert loader_class == PostgreSQLLoader
 
+    def test_get_arrow_loader(self):
+        loader_class = get_loader("arrow")
+        assert loader_class == ArrowIPCLoader
+
+    def test_loader_modules_imported_on_first_use(self):
+        code = (
+            "import sys; import finetl.loading as loading; "
+            "assert 'finetl.loading.postgresql' not in sys.modules; "
+            "loading.get_loader('postgresql'); "
+            "assert 'finetl.loading.postgresql' in sys.modules; "
+            "assert 'finetl.loading.huggingface' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize(
+        "destination", ["csv", "parquet", "huggingface", "postgresql", "arrow"]
+    )
+    def test_loader_exported_from_package(self, destination: str):
+        import finetl.loading
+
+        loader_class = get_loader(destination)
+        assert loader_class.__name__ in finetl.loading.__all__
+        assert getattr(finetl.loading, loader_class.__name__) is loader_class
+
     def test_get_unknown_loader(self):
         with pytest.raises(ConfigurationError, match="Unsupported destination type"):
             get_loader("unknown")
@@ -576,3 +1280,19 @@ class TestLoaderRegistry:
 
         register_loader("custom", CustomLoader)
         assert get_loader("custom") == CustomLoader
+
+        with pytest.raises(ConfigurationError, match="arrow, custom"):
+            get_loader("unknown")
+
+    def test_register_loader_overrides_cached_lookup(self):
+        class FirstLoader(BaseLoader):
+            def load(self, data: ExtractedData) -> None:
+                pass
+
+        class SecondLoader(FirstLoader):
+            pass
+
+        register_loader("override", FirstLoader)
+        assert get_loader("override") == FirstLoader
+        register_loader("override", SecondLoader)
+        assert get_loader("override") == SecondLoader
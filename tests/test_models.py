@@ -0,0 +1,42 @@
+"""Tests for data models."""
+
+import pandas as pd
+import pytest
+
+from finetl.models import ExtractedData
+
+
+class TestExtractedData:
+    """Tests for ExtractedData."""
+
+    @pytest.mark.parametrize(
+        ("ohlcv", "expected"),
+        [(None, False), (pd.DataFrame(), False), (pd.DataFrame({"a": [1]}), True)],
+        ids=["none", "empty", "populated"],
+    )
+    def test_has_ohlcv(self, ohlcv: pd.DataFrame | None, expected: bool):
+        data = ExtractedData(ohlcv=ohlcv, financials=None)
+
+        assert data.has_ohlcv is expected
+        assert data.has_financials is False
+        assert bool(data) is expected
+
+    @pytest.mark.parametrize(
+        ("financials", "expected"),
+        [(None, False), (pd.DataFrame(), False), (pd.DataFrame({"a": [1]}), True)],
+        ids=["none", "empty", "populated"],
+    )
+    def test_has_financials(self, financials: pd.DataFrame | None, expected: bool):
+        data = ExtractedData(ohlcv=None, financials=financials)
+
+        assert data.has_financials is expected
+        assert data.has_ohlcv is False
+        assert bool(data) is expected
+
+    def test_empty_frame_with_columns(self):
+        empty = pd.DataFrame(columns=["ticker", "date"])
+        data = ExtractedData(ohlcv=empty, financials=empty)
+
+        assert not data.has_ohlcv
+        assert not data.has_financials
+        assert not data
@@ -0,0 +1,68 @@
+"""Tests for the helper scripts."""
+
+import importlib.util
+import time
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+@pytest.fixture
+def push_script() -> ModuleType:
+    """Import scripts/push_ohlcv_to_hf.py as a module."""
+    path = SCRIPTS_DIR / "push_ohlcv_to_hf.py"
+    spec = importlib.util.spec_from_file_location("push_ohlcv_to_hf", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestCachedWhoami:
+    """Tests for the cached HuggingFace whoami lookup."""
+
+    def test_reuses_result_for_same_token(
+        self, push_script: ModuleType, config_cache_dir: Path
+    ):
+        api = MagicMock()
+        api.whoami.return_value = {"name": "user", "email": "user@example.com"}
+
+        with patch("huggingface_hub.get_token", return_value="token"):
+            first = push_script.cached_whoami(api)
+            second = push_script.cached_whoami(api)
+
+        assert first == second == {"name": "user", "email": "user@example.com"}
+        assert api.whoami.call_count == 1
+        cache_file = config_cache_dir / push_script.WHOAMI_CACHE_NAME
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_result_is_refetched(
+        self, push_script: ModuleType, config_cache_dir: Path
+    ):
+        api = MagicMock()
+        api.whoami.return_value = {"name": "user"}
+
+        with patch("huggingface_hub.get_token", return_value="token"):
+            push_script.cached_whoami(api)
+            later = time.time() + push_script.WHOAMI_CACHE_TTL + 1
+            with patch.object(push_script.time, "time", return_value=later):
+                push_script.cached_whoami(api)
+
+        assert api.whoami.call_count == 2
+
+    def test_token_change_is_refetched(
+        self, push_script: ModuleType, config_cache_dir: Path
+    ):
+        api = MagicMock()
+        api.whoami.side_effect = [{"name": "first"}, {"name": "second"}]
+
+        with patch("huggingface_hub.get_token", return_value="token-a"):
+            push_script.cached_whoami(api)
+        with patch("huggingface_hub.get_token", return_value="token-b"):
+            result = push_script.cached_whoami(api)
+
+        assert result == {"name": "second"}
+        assert api.whoami.call_count == 2